@@ -1,10 +1,28 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template, stream_with_context
 from flask_cors import CORS
 import csv
 import os
 import sys
+import gzip
+import json
+import time
+import hashlib
+import datetime
 from pathlib import Path
 from dotenv import load_dotenv
+from werkzeug.http import is_resource_modified
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from modules.history_index import query_history
+from modules.log_tail import tail_lines, read_since
+from modules.bot_control import is_bot_running, start_bot, stop_bot
+from modules.bot_status import read_status, read_term_rollups, read_median_application_secs
+from modules.history_stats import get_rollup, daily_series, top_counts
+from modules.config_store import get_config, forget_config, write_config_file, config_file_lock
 
 app = Flask(__name__)
 CORS(app)
@@ -18,169 +36,93 @@ PATH = "all excels/"
 os.makedirs(PATH, exist_ok=True)
 os.makedirs("logs", exist_ok=True)
 
-
-def read_config_file(filename):
-    """Read a config file and return its variables as a dict"""
-    config = {}
-    filepath = f"config/{filename}"
-
-    if not os.path.exists(filepath):
-        return config
-
+# Smaller responses aren't worth compressing
+COMPRESS_MIN_BYTES = 1024
+
+
+@app.after_request
+def compress_response(response):
+    """Compress responses with brotli (if installed) or gzip when the browser accepts it"""
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or response.mimetype == "text/event-stream"
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return response
+    if brotli is not None and request.accept_encodings["br"]:
+        response.set_data(brotli.compress(data, quality=5))
+        response.headers["Content-Encoding"] = "br"
+    elif request.accept_encodings["gzip"]:
+        response.set_data(gzip.compress(data, compresslevel=6))
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        return response
+    # Compressed bytes differ from the ones the ETag was made for
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def conditional_json(build, etag, last_modified=None):
+    """JSON of `build()`, or 304 Not Modified without calling it if the browser's copy (If-None-Match, If-Modified-Since) is current"""
+    if etag and not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = Response(status=304)
+    else:
+        response = jsonify(build())
+    if etag:
+        response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    # Browser keeps the response but asks every time, the answer is a 304 until it changes
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def file_validators(path, variant=""):
+    """ETag and Last-Modified of `path` from its modification time and size, `variant` tells apart different responses made from the same file"""
     try:
-        # Use importlib to properly parse the Python file
-        import importlib.util
-
-        spec = importlib.util.spec_from_file_location("config_module", filepath)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            # Get all non-private attributes
-            for attr in dir(module):
-                if not attr.startswith("_"):
-                    value = getattr(module, attr)
-                    if not callable(value):
-                        config[attr] = value
-    except Exception as e:
-        print(f"Error reading {filename}: {e}")
-
-    return config
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    # Parse manually - handle multiline strings
-    import re
-
-    # Find all variable assignments - handle multiline strings
-    lines = content.split("\n")
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Skip empty lines, comments, and docstrings
-        if (
-            not line
-            or line.startswith("#")
-            or line.startswith("'''")
-            or line.startswith('"""')
-        ):
-            i += 1
-            continue
-
-        # Check for variable assignment
-        if "=" in line:
-            parts = line.split("=", 1)
-            key = parts[0].strip()
-            value_part = parts[1].strip()
-
-            if key and value_part:
-                # Handle different types
-                if value_part.startswith("[") and value_str.endswith("]"):
-                    # List - find the end
-                    pass
-                elif value_part.lower() in ("true", "false"):
-                    config[key] = value_part.lower() == "true"
-                elif value_part.isdigit():
-                    config[key] = int(value_part)
-                elif value_part.startswith('"') or value_part.startswith("'"):
-                    # String - could be multiline
-                    quote = value_part[0]
-                    if value_part.count(quote) >= 2 and value_part.endswith(quote):
-                        # Single line string
-                        config[key] = value_part[1:-1]
-                    else:
-                        # Multi-line string - collect all lines until closing quote
-                        result = value_part[1:] if len(value_part) > 1 else ""
-                        i += 1
-                        while i < len(lines):
-                            if quote in lines[i]:
-                                result += "\n" + lines[i].split(quote)[0]
-                                break
-                            result += "\n" + lines[i]
-                            i += 1
-                        config[key] = result
-                else:
-                    config[key] = value_part
-
-        i += 1
-
-    return config
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    # Parse the content manually to handle quotes properly
-    import re
-
-    # Find all variable assignments: key = value
-    # Handle strings with single or double quotes, and lists
-    pattern = r"^(\w+)\s*=\s*(.+?)$"
-
-    for line in content.split("\n"):
-        line = line.strip()
-        if not line or line.startswith("#") or line.startswith("'''"):
-            continue
-
-        match = re.match(pattern, line, re.MULTILINE)
-        if match:
-            key = match.group(1)
-            value_str = match.group(2).strip()
-
-            # Handle different value types
-            if value_str.startswith("[") and value_str.endswith("]"):
-                # It's a list
-                try:
-                    value = eval(value_str)
-                except:
-                    value = []
-            elif value_str.lower() in ("true", "false"):
-                value = value_str.lower() == "true"
-            elif value_str.isdigit():
-                value = int(value_str)
-            elif value_str.startswith('"') and value_str.endswith('"'):
-                value = value_str[1:-1]
-            elif value_str.startswith("'") and value_str.endswith("'"):
-                value = value_str[1:-1]
-            else:
-                value = value_str
-
-            config[key] = value
-
-    return config
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return hashlib.sha1(f"missing|{variant}".encode("utf-8")).hexdigest(), None
+    etag = hashlib.sha1(f"{stat.st_mtime_ns}|{stat.st_size}|{variant}".encode("utf-8")).hexdigest()
+    return etag, datetime.datetime.fromtimestamp(stat.st_mtime, datetime.timezone.utc)
 
 
 def save_config_file(config_dict, filename):
     """Save config dict to file"""
-    filepath = f"config/{filename}"
-
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write("'''\nAuthor: Generated by UI\n'''\n\n")
-        for key, value in config_dict.items():
-            if isinstance(value, bool):
-                f.write(f"{key} = {str(value)}\n")
-            elif isinstance(value, int):
-                f.write(f"{key} = {value}\n")
-            elif isinstance(value, list):
-                f.write(f"{key} = {value}\n")
-            elif isinstance(value, str):
-                if "\n" in value or len(value) > 100:
-                    # Multi-line or long string - use triple quotes
-                    f.write(f'{key} = """{value}"""\n')
-                else:
-                    # Simple string
-                    f.write(f'{key} = "{value}"\n')
+    lines = ["'''\nAuthor: Generated by UI\n'''\n\n"]
+    for key, value in config_dict.items():
+        if isinstance(value, bool):
+            lines.append(f"{key} = {str(value)}\n")
+        elif isinstance(value, int):
+            lines.append(f"{key} = {value}\n")
+        elif isinstance(value, list):
+            lines.append(f"{key} = {value}\n")
+        elif isinstance(value, str):
+            if "\n" in value or len(value) > 100:
+                # Multi-line or long string - use triple quotes
+                lines.append(f'{key} = """{value}"""\n')
             else:
-                f.write(f'{key} = "{value}"\n')
+                # Simple string
+                lines.append(f'{key} = "{value}"\n')
+        else:
+            lines.append(f'{key} = "{value}"\n')
+    write_config_file(filename, "".join(lines))
 
 
-# Load configs
-personals = read_config_file("personals.py")
-search_mod = read_config_file("search.py")
-secrets_mod = read_config_file("secrets.py")
-settings_mod = read_config_file("settings.py")
-questions_mod = read_config_file("questions.py")
+def config_response(filename):
+    """Config file variables from memory, or 304 Not Modified if the browser's copy is current"""
+    config, etag = get_config(filename)
+    _, last_modified = file_validators(f"config/{filename}")
+    return conditional_json(lambda: config, etag, last_modified)
 
 
 @app.route("/")
@@ -188,83 +130,122 @@ def home():
     return render_template("index.html")
 
 
+APPLIED_JOBS_COLUMNS = {
+    "Job_ID": "Job ID",
+    "Title": "Title",
+    "Company": "Company",
+    "Work_Location": "Work Location",
+    "Work_Style": "Work Style",
+    "Date_Applied": "Date Applied",
+    "Job_Link": "Job Link",
+    "External_Job_link": "External Job link",
+}
+
+FAILED_JOBS_COLUMNS = {
+    "Job_ID": "Job ID",
+    "Title": "Title",
+    "Company": "Company",
+    "Job_Link": "Job Link",
+    "Date_Tried": "Date Tried",
+    "Assumed_Reason": "Assumed Reason",
+}
+
+
+def query_history_from_request(csv_path, columns, date_column):
+    """Get the page of a history CSV asked for in the query string, or 304 Not Modified if the CSV didn't change since the browser got it"""
+    args = request.args
+    etag, last_modified = file_validators(csv_path, request.query_string.decode("utf-8", errors="replace"))
+    return conditional_json(
+        lambda: query_history(
+            csv_path,
+            columns,
+            date_column,
+            limit=args.get("limit"),
+            cursor=args.get("cursor"),
+            q=args.get("q"),
+            company=args.get("company"),
+            date_from=args.get("date_from"),
+            date_to=args.get("date_to"),
+            sort=args.get("sort"),
+        ),
+        etag,
+        last_modified,
+    )
+
+
 @app.route("/applied-jobs", methods=["GET"])
 def get_applied_jobs():
+    """Page of applied jobs. Query: limit, cursor, q, company, date_from, date_to, sort"""
     try:
-        jobs = []
         csv_path = PATH + "all_applied_applications_history.csv"
-        if not os.path.exists(csv_path):
-            return jsonify([])
-
-        with open(csv_path, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                jobs.append(
-                    {
-                        "Job_ID": row.get("Job ID", ""),
-                        "Title": row.get("Title", ""),
-                        "Company": row.get("Company", ""),
-                        "Work_Location": row.get("Work Location", ""),
-                        "Work_Style": row.get("Work Style", ""),
-                        "Date_Applied": row.get("Date Applied", ""),
-                        "Job_Link": row.get("Job Link", ""),
-                        "External_Job_link": row.get("External Job link", ""),
-                    }
-                )
-        return jsonify(jobs)
+        return query_history_from_request(csv_path, APPLIED_JOBS_COLUMNS, "Date Applied")
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/failed-jobs", methods=["GET"])
 def get_failed_jobs():
+    """Page of failed jobs. Query: limit, cursor, q, company, date_from, date_to, sort"""
     try:
-        jobs = []
         csv_path = PATH + "all_failed_applications_history.csv"
-        if not os.path.exists(csv_path):
-            return jsonify([])
-
-        with open(csv_path, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                jobs.append(
-                    {
-                        "Job_ID": row.get("Job ID", ""),
-                        "Title": row.get("Title", ""),
-                        "Company": row.get("Company", ""),
-                        "Job_Link": row.get("Job Link", ""),
-                    }
-                )
-        return jsonify(jobs)
+        return query_history_from_request(csv_path, FAILED_JOBS_COLUMNS, "Date Tried")
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/stats", methods=["GET"])
+def get_stats():
+    """Totals per day, company, failure reason and search term. Query: days (length of the daily series, default 30)"""
+    days = min(max(request.args.get("days", 30, type=int), 1), 365)
+    try:
+        applied = get_rollup(PATH + "all_applied_applications_history.csv", APPLIED_JOBS_COLUMNS, "Date Applied")
+        failed = get_rollup(PATH + "all_failed_applications_history.csv", FAILED_JOBS_COLUMNS, "Date Tried")
+        return jsonify({
+            "applied": {
+                "total": applied["total"],
+                "daily": daily_series(applied["daily"], days),
+                "top_companies": top_counts(applied["companies"], "company"),
+            },
+            "failed": {
+                "total": failed["total"],
+                "daily": daily_series(failed["daily"], days),
+                "top_reasons": top_counts(failed["reasons"], "reason"),
+            },
+            # Recorded by the bot, not in the CSVs
+            "search_terms": read_term_rollups(),
+            "median_secs_per_application": read_median_application_secs(),
+        })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 @app.route("/config/personals", methods=["GET", "POST"])
 def config_personals():
-    global personals
     if request.method == "GET":
-        return jsonify(personals)
+        return config_response("personals.py")
 
     data = request.json
-    personals.update(data)
-    save_config_file(personals, "personals.py")
+    with config_file_lock("personals.py"):
+        config, _ = get_config("personals.py")
+        config.update(data)
+        save_config_file(config, "personals.py")
     return jsonify({"success": True})
 
 
 @app.route("/config/search", methods=["GET", "POST"])
 def config_search():
-    global search_mod
     if request.method == "GET":
-        return jsonify(search_mod)
+        return config_response("search.py")
 
     data = request.json
     # Ensure search_terms has at least one item
     if not data.get("search_terms") or len(data["search_terms"]) == 0:
         data["search_terms"] = ["Software Engineer"]
 
-    search_mod.update(data)
-    save_config_file(search_mod, "search.py")
+    with config_file_lock("search.py"):
+        config, _ = get_config("search.py")
+        config.update(data)
+        save_config_file(config, "search.py")
     return jsonify({"success": True})
 
 
@@ -327,37 +308,43 @@ def save_env_config(config_dict):
 
 @app.route("/config/secrets", methods=["GET", "POST"])
 def config_secrets():
-    global secrets_mod
     if request.method == "GET":
-        return jsonify(secrets_mod)
+        return config_response("secrets.py")
 
     data = request.json
-    secrets_mod.update(data)
-    save_env_config(secrets_mod)
+    with config_file_lock("secrets.py"):
+        config, _ = get_config("secrets.py")
+        config.update(data)
+        save_env_config(config)
+        # secrets.py reads .env, load what was saved so the next GET returns it
+        load_dotenv(override=True)
+        forget_config("secrets.py")
     return jsonify({"success": True})
 
 
 @app.route("/config/settings", methods=["GET", "POST"])
 def config_settings():
-    global settings_mod
     if request.method == "GET":
-        return jsonify(settings_mod)
+        return config_response("settings.py")
 
     data = request.json
-    settings_mod.update(data)
-    save_config_file(settings_mod, "settings.py")
+    with config_file_lock("settings.py"):
+        config, _ = get_config("settings.py")
+        config.update(data)
+        save_config_file(config, "settings.py")
     return jsonify({"success": True})
 
 
 @app.route("/config/questions", methods=["GET", "POST"])
 def config_questions():
-    global questions_mod
     if request.method == "GET":
-        return jsonify(questions_mod)
+        return config_response("questions.py")
 
     data = request.json
-    questions_mod.update(data)
-    save_config_file(questions_mod, "questions.py")
+    with config_file_lock("questions.py"):
+        config, _ = get_config("questions.py")
+        config.update(data)
+        save_config_file(config, "questions.py")
     return jsonify({"success": True})
 
 
@@ -380,94 +367,158 @@ def get_resumes():
     return jsonify(resumes)
 
 
-# Bot control
-import subprocess
-import os
-import datetime
-
-bot_process = None
+# Bot control, the bot process itself is kept by modules/bot_control.py
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BOT_LOG_FILE = os.path.join(SCRIPT_DIR, "logs", "bot_ui.log")
 
 
 @app.route("/bot/start", methods=["POST"])
 def bot_start():
-    global bot_process
-
-    if bot_process and bot_process.poll() is None:
-        return jsonify({"error": "El bot ya está ejecutándose"}), 400
-
     try:
-        # Change to the script directory
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        log_file = os.path.join(script_dir, "logs", "bot_ui.log")
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
-
-        # Start the bot in a subprocess with output to file
-        log_handle = open(log_file, "w")
-
-        bot_process = subprocess.Popen(
-            [sys.executable, "runAiBot.py"],
-            cwd=script_dir,
-            stdout=log_handle,
-            stderr=subprocess.STDOUT,
-            text=True,
-            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
-        )
-        print(f"Bot process started with PID: {bot_process.pid}")
-        return jsonify(
-            {"message": "Bot iniciado correctamente", "pid": bot_process.pid}
-        )
+        pid = start_bot(SCRIPT_DIR, BOT_LOG_FILE)
     except Exception as e:
         print(f"Error starting bot: {e}")
         return jsonify({"error": str(e)}), 500
 
+    if pid is None:
+        return jsonify({"error": "El bot ya está ejecutándose"}), 400
+    print(f"Bot process started with PID: {pid}")
+    return jsonify({"message": "Bot iniciado correctamente", "pid": pid})
+
 
 @app.route("/bot/stop", methods=["POST"])
 def bot_stop():
-    global bot_process
-
-    if bot_process:
-        bot_process.terminate()
-        bot_process = None
+    if stop_bot():
         return jsonify({"message": "Bot detenido"})
 
     return jsonify({"error": "No hay bot en ejecución"}), 400
 
+# How often the live stream checks the log file and status for changes
+STREAM_INTERVAL_SECS = 0.5
+STREAM_KEEPALIVE_SECS = 15
+
+
+def get_bot_status():
+    """Current bot status and counters, as last published by the bot process"""
+    running = is_bot_running()
+    status = {
+        "total_runs": 0,
+        "easy_applied_count": 0,
+        "external_jobs_count": 0,
+        "failed_count": 0,
+        "skip_count": 0,
+    }
+    status.update(read_status() or {})
+    # Only the last status of a previous run is left when the bot isn't running, it's not doing anything now
+    if not running and status.get("phase") not in (None, "finished"):
+        status["phase"] = "stopped"
+    status["running"] = running
+    return status
+
 
 @app.route("/bot/status", methods=["GET"])
 def bot_status():
-    global bot_process
-    running = bot_process is not None and bot_process.poll() is None
-    return jsonify(
-        {
-            "running": running,
-            "total_runs": 0,
-            "easy_applied_count": 0,
-            "external_jobs_count": 0,
-            "failed_count": 0,
-            "skip_count": 0,
-        }
+    return jsonify(get_bot_status())
+
+
+def format_sse(event, data, event_id=None):
+    """Format one Server-Sent Event"""
+    message = f"event: {event}\n"
+    if event_id is not None:
+        message += f"id: {event_id}\n"
+    return message + f"data: {json.dumps(data)}\n\n"
+
+
+@app.route("/bot/stream", methods=["GET"])
+def bot_stream():
+    """Server-Sent Events with new log lines (`logs`) and status changes (`status`), replaces polling /bot/logs and /bot/status"""
+    # Browsers send the id of the last event when they reconnect, it's the log offset
+    since = request.headers.get("Last-Event-ID", type=int)
+    if since is None:
+        since = request.args.get("since", type=int)
+    # A negative offset isn't one the server gave out, start over with the last lines
+    if since is not None and since < 0:
+        since = None
+
+    def events():
+        offset = since
+        last_status = None
+        last_sent = time.monotonic()
+        while True:
+            if offset is None:
+                lines, offset = tail_lines(BOT_LOG_FILE)
+                reset = True
+            else:
+                lines, offset, reset = read_since(BOT_LOG_FILE, offset)
+            if lines or reset:
+                yield format_sse("logs", {"logs": lines, "offset": offset, "reset": reset}, offset)
+                last_sent = time.monotonic()
+
+            status = get_bot_status()
+            if status != last_status:
+                yield format_sse("status", status)
+                last_status = status
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent > STREAM_KEEPALIVE_SECS:
+                # Comment line keeps proxies from closing an idle connection
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+            time.sleep(STREAM_INTERVAL_SECS)
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
 @app.route("/bot/logs", methods=["GET"])
 def bot_logs():
-    log_file = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), "logs", "bot_ui.log"
-    )
-    logs = []
+    """Last lines of the bot log, or only the lines written after `since` (the `offset` of the previous call)"""
+    log_file = BOT_LOG_FILE
+    since = request.args.get("since", type=int)
+    if since is not None and since < 0:
+        since = None
+    max_lines = min(max(request.args.get("lines", 100, type=int), 1), 1000)
+    logs, offset, reset = [], since or 0, since is None
     try:
-        if os.path.exists(log_file):
-            with open(log_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                logs = [line.strip() for line in lines[-100:]]  # Last 100 lines
+        if since is None:
+            logs, offset = tail_lines(log_file, max_lines)
+        else:
+            logs, offset, reset = read_since(log_file, since, max_lines)
     except Exception as e:
         logs = [f"Error reading logs: {str(e)}"]
 
-    if not logs:
+    if not logs and since is None:
         logs = ["No hay logs todavía"]
 
-    return jsonify({"logs": logs})
+    return jsonify({"logs": logs, "offset": offset, "reset": reset})
+
+
+def serve(host="127.0.0.1", port=5000, threads=8):
+    """Serve the dashboard with waitress if installed, else with the threaded Werkzeug server without debugger and reloader"""
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        print("waitress is not installed (pip install waitress), using the threaded Werkzeug server.")
+        app.run(host=host, port=port, debug=False, use_reloader=False, threaded=True)
+        return
+    print(f"Serving the dashboard on http://{host}:{port} with {threads} threads.")
+    # Every open Run page keeps one thread busy with its live stream (/bot/stream)
+    waitress_serve(app, host=host, port=port, threads=threads)
 
 
 if __name__ == "__main__":
-    app.run(debug=True, port=5000)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Dashboard of the LinkedIn job applier")
+    parser.add_argument("--production", action="store_true", help="serve with a multi-threaded WSGI server instead of the debug server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=8, help="request threads of the production server")
+    args = parser.parse_args()
+
+    if args.production:
+        serve(args.host, args.port, max(args.threads, 1))
+    else:
+        app.run(host=args.host, port=args.port, debug=True, threaded=True)
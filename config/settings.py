@@ -64,6 +64,38 @@ file_name = "all excels/all_applied_applications_history.csv"
 failed_file_name = "all excels/all_failed_applications_history.csv"
 logs_folder_path = "logs/"
 
+# Folder where the bot keeps its persistent caches between runs (seen jobs, etc.). Delete it to make the bot forget everything it learned.
+cache_folder_path = "logs/cache/"
+
+# How many days should a rejected job (bad words, experience too high, non-English, etc.) be remembered, so it's skipped from the job card without opening it again?
+seen_jobs_ttl_days = 7              # Only Non Negative Integers Eg: 0, 1, 7, 30... (0 disables the seen jobs index)
+
+# How many days should the result of checking a company's "About the company" against about_company_good_words and about_company_bad_words be remembered? Repeated companies are then accepted or rejected straight from the job card.
+company_verdict_ttl_days = 30       # Only Non Negative Integers Eg: 0, 7, 30... (0 disables remembering companies)
+
+# If the bot is interrupted (Chrome crashed, program killed, etc.), continue from the same search term, page and job on the next start instead of starting over?
+resume_from_checkpoint = True       # True or False, Note: True or False are case-sensitive
+
+# Save LinkedIn login cookies in login_cookies_file_path, so the next run doesn't need to log in again?
+# WARNING: The file holds your LinkedIn session, anyone who gets a copy of it is logged in as you. Never share it or the folder it's in!
+remember_login = False              # True or False, Note: True or False are case-sensitive
+
+# Where LinkedIn login cookies are kept when remember_login is True. Outside "logs/" on purpose, so it isn't shared with logs in bug reports.
+login_cookies_file_path = "~/.auto_job_applier/linkedin_cookies.json"   # Any file path, "~" is your home folder (only readable by you)
+
+# Image format of the screenshots saved in logs/screenshots when the bot gets stuck or fails. "jpeg" and "webp" are much smaller than "png".
+screenshot_format = "jpeg"          # "png", "jpeg" or "webp"
+screenshot_quality = 60             # Integers between 1 and 100 (Ignored for "png")
+
+# Maximum number of screenshots saved per run. Identical failure screens are only saved once.
+max_screenshots_per_run = 50        # Only Non Negative Integers Eg: 0, 10, 50... (0 disables screenshots)
+
+# When an unexpected error happens, the page HTML is saved as a gzip compressed file in logs/snapshots and referenced by id in log.txt. How big can a snapshot be before compression?
+max_page_snapshot_kb = 512          # Only Non Negative Integers Eg: 0, 256, 512... (0 disables page snapshots)
+
+# Save only the relevant parts of the page (job list, job details and application dialog) instead of the whole page?
+page_snapshot_subtrees_only = True  # True or False, Note: True or False are case-sensitive
+
 # Set the maximum amount of time allowed to wait between each click in secs
 click_gap = 1                       # Enter max allowed secs to wait approximately. (Only Non Negative Integers Eg: 0,1,2,3,....)
 
@@ -85,9 +117,16 @@ keep_screen_awake = True            # True or False, Note: True or False are cas
 # Run in undetected mode to bypass anti-bot protections (Preview Feature, UNSTABLE. Recommended to leave it as False)
 stealth_mode = False               # True or False, Note: True or False are case-sensitive
 
+# Keep Chrome open when the bot stops and reconnect to it on the next run? Start-up is much faster and you stay logged in. (Close that Chrome window yourself when you are done)
+reuse_browser_session = False       # True or False, Note: True or False are case-sensitive
+remote_debugging_port = 9222        # Integers between 1024 and 65535 (Port the reused Chrome listens on, change it if something else already uses it)
+
 # Do you want to get alerts on errors related to AI API connection?
 showAiErrorAlerts = False            # True or False, Note: True or False are case-sensitive
 
+# How many days should the bot trust that your AI model exists, before fetching the provider's models list again to check? (It's always checked again if the AI stops answering)
+ai_model_validation_ttl_days = 7    # Only Non Negative Integers Eg: 0, 1, 7... (0 checks the models list on every start)
+
 # Use ChatGPT for resume building (Experimental Feature can break the application. Recommended to leave it as False) 
 # use_resume_generator = False       # True or False, Note: True or False are case-sensitive ,   This feature may only work with 'stealth_mode = True'. As ChatGPT website is hosted by CloudFlare which is protected by Anti-bot protections!
 
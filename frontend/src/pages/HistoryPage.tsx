@@ -1,30 +1,42 @@
 import { useState, useEffect } from 'react';
 import { ExternalLink, Search, Filter } from 'lucide-react';
 import { jobsApi } from '../services/api';
-import type { JobHistory } from '../types/config';
+import type { HistoryResponse } from '../types/config';
 import './ConfigForms.css';
 
+const PAGE_SIZE = 50;
+
+const emptyPage: HistoryResponse = { items: [], total: 0, next_cursor: null, companies: [] };
+
 export function HistoryPage() {
-  const [jobs, setJobs] = useState<JobHistory[]>([]);
-  const [failedJobs, setFailedJobs] = useState<JobHistory[]>([]);
+  const [applied, setApplied] = useState<HistoryResponse>(emptyPage);
+  const [failed, setFailed] = useState<HistoryResponse>(emptyPage);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [activeTab, setActiveTab] = useState<'applied' | 'failed'>('applied');
   const [searchTerm, setSearchTerm] = useState('');
   const [filterCompany, setFilterCompany] = useState('');
 
+  // Filtering happens on the server, wait until the user stops typing
   useEffect(() => {
-    loadData();
-  }, []);
+    const timer = setTimeout(loadData, 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm, filterCompany]);
+
+  const filters = () => ({
+    limit: PAGE_SIZE,
+    q: searchTerm || undefined,
+    company: filterCompany || undefined,
+  });
 
   const loadData = async () => {
-    setLoading(true);
     try {
-      const [applied, failed] = await Promise.all([
-        jobsApi.getHistory(),
-        jobsApi.getFailed(),
+      const [appliedPage, failedPage] = await Promise.all([
+        jobsApi.getHistory(filters()),
+        jobsApi.getFailed(filters()),
       ]);
-      setJobs(applied);
-      setFailedJobs(failed);
+      setApplied(appliedPage);
+      setFailed(failedPage);
     } catch (error) {
       console.error('Failed to load jobs:', error);
     } finally {
@@ -32,21 +44,27 @@ export function HistoryPage() {
     }
   };
 
-  const currentJobs = activeTab === 'applied' ? jobs : failedJobs;
-  
-  const filteredJobs = currentJobs.filter(job => {
-    const matchesSearch = !searchTerm || 
-      job.Title?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      job.Company?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      job.Job_ID?.toLowerCase().includes(searchTerm.toLowerCase());
-    
-    const matchesCompany = !filterCompany || 
-      job.Company?.toLowerCase().includes(filterCompany.toLowerCase());
-    
-    return matchesSearch && matchesCompany;
-  });
+  const loadMore = async () => {
+    const current = activeTab === 'applied' ? applied : failed;
+    if (!current.next_cursor) return;
+    setLoadingMore(true);
+    try {
+      const fetchPage = activeTab === 'applied' ? jobsApi.getHistory : jobsApi.getFailed;
+      const page = await fetchPage({ ...filters(), cursor: current.next_cursor });
+      const merged = { ...page, items: [...current.items, ...page.items] };
+      if (activeTab === 'applied') setApplied(merged);
+      else setFailed(merged);
+    } catch (error) {
+      console.error('Failed to load more jobs:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
-  const companies = [...new Set(currentJobs.map(j => j.Company).filter(Boolean))];
+  const current = activeTab === 'applied' ? applied : failed;
+  const filteredJobs = current.items;
+  const hasFilters = Boolean(searchTerm || filterCompany);
+  const companies = current.companies;
 
   const formatDate = (dateStr: string | undefined) => {
     if (!dateStr || dateStr === 'Pending') return 'Pendiente';
@@ -69,13 +87,13 @@ export function HistoryPage() {
           className={`config-tab ${activeTab === 'applied' ? 'active' : ''}`}
           onClick={() => setActiveTab('applied')}
         >
-          Aplicadas ({jobs.length})
+          Aplicadas ({applied.total})
         </button>
         <button
           className={`config-tab ${activeTab === 'failed' ? 'active' : ''}`}
           onClick={() => setActiveTab('failed')}
         >
-          Fallidas ({failedJobs.length})
+          Fallidas ({failed.total})
         </button>
       </div>
 
@@ -128,7 +146,7 @@ export function HistoryPage() {
           <Search size={48} />
           <h3>No se encontraron empleos</h3>
           <p>
-            {currentJobs.length === 0 
+            {!hasFilters 
               ? 'Aún no hay postulaciones en el historial'
               : 'No hay resultados que coincidan con los filtros'
             }
@@ -191,6 +209,13 @@ export function HistoryPage() {
               ))}
             </tbody>
           </table>
+          {current.next_cursor && (
+            <div style={{ textAlign: 'center', padding: '16px' }}>
+              <button className="btn btn-secondary" onClick={loadMore} disabled={loadingMore}>
+                {loadingMore ? 'Cargando...' : `Cargar más (${filteredJobs.length} de ${current.total})`}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -1,9 +1,13 @@
 import { useState, useEffect, useRef } from 'react';
 import { Play, Square, RefreshCw, Activity } from 'lucide-react';
 import { botApi, configApi } from '../services/api';
-import type { BotStatus, SearchConfig } from '../types/config';
+import type { BotLogs, BotStatus, SearchConfig } from '../types/config';
 import './ConfigForms.css';
 
+const MAX_LOG_LINES = 1000;
+// Stream errors in a row (without a message in between) before giving up on it and polling instead
+const MAX_STREAM_ERRORS = 3;
+
 export function RunPage() {
   const [status, setStatus] = useState<BotStatus>({
     running: false,
@@ -20,19 +24,46 @@ export function RunPage() {
   const [loading, setLoading] = useState(false);
   const [searchConfig, setSearchConfig] = useState<SearchConfig | null>(null);
   const logsEndRef = useRef<HTMLDivElement>(null);
+  // Byte offset in the log file up to which lines were already fetched
+  const logOffsetRef = useRef<number | undefined>(undefined);
+  // Falls back to polling if the browser or server can't keep the live stream open
+  const [streamFailed, setStreamFailed] = useState(typeof EventSource === 'undefined');
 
   useEffect(() => {
     loadInitialData();
-    
-    const interval = setInterval(() => {
-      if (status.running) {
+  }, []);
+
+  useEffect(() => {
+    if (!status.running) return;
+
+    if (streamFailed) {
+      const interval = setInterval(() => {
         fetchStatus();
         fetchLogs();
-      }
-    }, 2000);
+      }, 2000);
+      return () => clearInterval(interval);
+    }
 
-    return () => clearInterval(interval);
-  }, [status.running]);
+    const source = new EventSource(botApi.streamUrl(logOffsetRef.current));
+    let errors = 0;
+    source.addEventListener('logs', (event) => {
+      errors = 0;
+      applyLogs(JSON.parse((event as MessageEvent).data));
+    });
+    source.addEventListener('status', (event) => {
+      errors = 0;
+      setStatus(prev => ({ ...prev, ...JSON.parse((event as MessageEvent).data) }));
+    });
+    source.onerror = () => {
+      // The browser reconnects by itself (resuming from the last event id), only poll if it gave up or keeps failing
+      errors += 1;
+      if (source.readyState === EventSource.CLOSED || errors >= MAX_STREAM_ERRORS) {
+        source.close();
+        setStreamFailed(true);
+      }
+    };
+    return () => source.close();
+  }, [status.running, streamFailed]);
 
   useEffect(() => {
     logsEndRef.current?.scrollIntoView({ behavior: 'smooth' });
@@ -57,10 +88,18 @@ export function RunPage() {
     }
   };
 
+  const applyLogs = (data: BotLogs) => {
+    logOffsetRef.current = data.offset;
+    if (data.reset) {
+      setLogs(data.logs || []);
+    } else if (data.logs?.length) {
+      setLogs(prev => [...prev, ...data.logs].slice(-MAX_LOG_LINES));
+    }
+  };
+
   const fetchLogs = async () => {
     try {
-      const data = await botApi.logs();
-      setLogs(data.logs || []);
+      applyLogs(await botApi.logs(logOffsetRef.current));
     } catch (error) {
       console.error('Failed to fetch logs:', error);
     }
@@ -71,6 +110,8 @@ export function RunPage() {
     try {
       await botApi.start(searchConfig || undefined);
       setStatus(prev => ({ ...prev, running: true }));
+      // New run starts a new log file
+      logOffsetRef.current = undefined;
       fetchLogs();
     } catch (error) {
       console.error('Failed to start bot:', error);
@@ -110,7 +151,7 @@ export function RunPage() {
           <h3>{status.running ? 'Bot en ejecución' : 'Bot detenido'}</h3>
           <p>
             {status.running 
-              ? `Buscando: ${status.current_search_term || 'Iniciando...'}`
+              ? `Buscando: ${status.current_search_term || 'Iniciando...'}${status.current_page ? ` (página ${status.current_page})` : ''}`
               : 'Listo para iniciar'
             }
           </p>
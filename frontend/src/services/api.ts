@@ -6,7 +6,9 @@ import type {
   SettingsConfig, 
   QuestionsConfig,
   BotStatus,
-  JobHistory 
+  BotLogs,
+  HistoryQuery,
+  HistoryResponse
 } from '../types/config';
 
 const API_BASE = 'http://localhost:5000';
@@ -98,20 +100,24 @@ export const botApi = {
     return response.data;
   },
 
-  logs: async () => {
-    const response = await api.get('/bot/logs');
+  // Server-Sent Events with `logs` and `status` events, see /bot/stream in app.py
+  streamUrl: (since?: number) =>
+    `${API_BASE}/bot/stream${since !== undefined ? `?since=${since}` : ''}`,
+
+  logs: async (since?: number): Promise<BotLogs> => {
+    const response = await api.get('/bot/logs', { params: { since } });
     return response.data;
   },
 };
 
 export const jobsApi = {
-  getHistory: async (): Promise<JobHistory[]> => {
-    const response = await api.get('/applied-jobs');
+  getHistory: async (query: HistoryQuery = {}): Promise<HistoryResponse> => {
+    const response = await api.get('/applied-jobs', { params: query });
     return response.data;
   },
 
-  getFailed: async (): Promise<JobHistory[]> => {
-    const response = await api.get('/failed-jobs');
+  getFailed: async (query: HistoryQuery = {}): Promise<HistoryResponse> => {
+    const response = await api.get('/failed-jobs', { params: query });
     return response.data;
   },
 
@@ -107,6 +107,15 @@ export interface BotStatus {
   current_search_term: string;
   current_job_title: string;
   current_company: string;
+  current_job_id?: string | null;
+  current_page?: number;
+  current_term_index?: number;
+  search_terms_count?: number;
+  phase?: string;
+  phase_started_at?: number;
+  last_step?: { phase: string; secs: number } | null;
+  step_timings?: Record<string, { count: number; total_secs: number; avg_secs: number }>;
+  updated_at?: number;
 }
 
 export interface JobHistory {
@@ -128,6 +137,31 @@ export interface JobHistory {
   External_Job_link: string;
   Questions_Found: string;
   Connect_Request: string;
+  Date_Tried?: string;
+  Assumed_Reason?: string;
+}
+
+export interface BotLogs {
+  logs: string[];
+  offset: number;
+  reset: boolean;
+}
+
+export interface HistoryQuery {
+  limit?: number;
+  cursor?: string | null;
+  q?: string;
+  company?: string;
+  date_from?: string;
+  date_to?: string;
+  sort?: 'date' | '-date' | 'company' | '-company' | 'title' | '-title';
+}
+
+export interface HistoryResponse {
+  items: JobHistory[];
+  total: number;
+  next_cursor: string | null;
+  companies: string[];
 }
 
 export type ConfigSection = 'search' | 'personals' | 'secrets' | 'settings' | 'questions';
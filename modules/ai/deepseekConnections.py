@@ -3,6 +3,7 @@ from config.secrets import *
 from config.settings import showAiErrorAlerts
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.http_pool import get_http_client, get_timeout
 
 from pyautogui import confirm
 from openai import OpenAI
@@ -28,7 +29,7 @@ def deepseek_create_client() -> OpenAI | None:
             base_url = base_url[:-1]
         
         # Create client with DeepSeek endpoint
-        client = OpenAI(base_url=base_url, api_key=llm_api_key)
+        client = OpenAI(base_url=base_url, api_key=llm_api_key, http_client=get_http_client())
         
         print_lg("---- SUCCESSFULLY CREATED DEEPSEEK CLIENT! ----")
         print_lg(f"Using API URL: {base_url}")
@@ -55,7 +56,7 @@ def deepseek_model_supports_temperature(model_name: str) -> bool:
     deepseek_models = ["deepseek-chat", "deepseek-reasoner"]
     return model_name in deepseek_models
 
-def deepseek_completion(client: OpenAI, messages: list[dict], response_format: dict = None, temperature: float = 0, stream: bool = stream_output) -> dict | ValueError:
+def deepseek_completion(client: OpenAI, messages: list[dict], response_format: dict = None, temperature: float = 0, stream: bool = stream_output, question_type: str | None = None) -> dict | ValueError:
     '''
     Completes a chat using DeepSeek API and formats the results.
     * Takes in `client` of type `OpenAI` - The DeepSeek client
@@ -63,6 +64,7 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
     * Takes in `response_format` of type `dict` for JSON representation (optional)
     * Takes in `temperature` of type `float` for randomness control (default 0)
     * Takes in `stream` of type `bool` for streaming output (optional)
+    * Takes in `question_type` of type `str` to pick the request timeout, short for single line answers (optional)
     * Returns the response as text or JSON
     '''
     if not client: 
@@ -75,7 +77,7 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
    
         "messages": messages, 
         "stream": stream,
-        "timeout": 30  
+        "timeout": get_timeout(question_type)
     }
     
     # Add temperature if supported
@@ -226,7 +228,8 @@ def deepseek_answer_question(
             client=client,
             messages=messages,
             temperature=0.1,  # Slight randomness for more natural responses
-            stream=stream
+            stream=stream,
+            question_type=question_type
         )
         
         return result
@@ -3,6 +3,7 @@ from config.secrets import llm_model, llm_api_key
 from config.settings import showAiErrorAlerts
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.model_cache import is_model_validated, remember_validated_model, forget_validated_model
 from pyautogui import confirm
 from typing import Literal
 
@@ -21,6 +22,17 @@ def gemini_get_models_list():
         critical_error_log("Error occurred while getting Gemini models list!", e)
         return ["error", e]
 
+def gemini_validate_model() -> None:
+    """
+    Checks if `llm_model` is available for content generation.
+    * Raises a `ValueError` if the models list can't be fetched or the model is not in it
+    """
+    models = gemini_get_models_list()
+    if "error" in models:
+        raise ValueError(models[1])
+    if not any(llm_model in m for m in models):
+         raise ValueError(f"Model `{llm_model}` is not found or not available for content generation!")
+
 def gemini_create_client():
     """
     Configures the Gemini client and validates the selected model.
@@ -33,11 +45,11 @@ def gemini_create_client():
         
         genai.configure(api_key=llm_api_key)
         
-        models = gemini_get_models_list()
-        if "error" in models:
-            raise ValueError(models[1])
-        if not any(llm_model in m for m in models):
-             raise ValueError(f"Model `{llm_model}` is not found or not available for content generation!")
+        if is_model_validated("gemini", None, llm_model):
+            print_lg(f"Model `{llm_model}` was found recently, skipping models list check.")
+        else:
+            gemini_validate_model()
+            remember_validated_model("gemini", None, llm_model)
 
         model = genai.GenerativeModel(llm_model)
         
@@ -110,6 +122,13 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
         return result
     except Exception as e:
         critical_error_log(f"Error occurred while getting Gemini completion!", e)
+        # Models list check was skipped at start-up, do it now if the model wasn't found (not on timeouts, rate limits, ...)
+        if getattr(e, "code", None) == 404 and forget_validated_model("gemini", None, llm_model):
+            try:
+                gemini_validate_model()
+                remember_validated_model("gemini", None, llm_model)
+            except Exception as validation_error:
+                critical_error_log("Gemini model is not available!", validation_error)
         return {"error": str(e)}
 
 def gemini_extract_skills(model, job_description: str) -> list[str] | None:
@@ -0,0 +1,54 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import httpx
+
+from modules.helpers import print_lg
+
+
+# Questions are answered one after another, a few warm connections are plenty
+POOL_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=120)
+
+# Single line answers should come back fast, paragraphs (textarea, skills extraction) take longer to generate
+SHORT_ANSWER_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+LONG_ANSWER_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+
+__http_client: httpx.Client | None = None
+
+
+def get_http_client() -> httpx.Client:
+    '''
+    Function to get the HTTP connection pool shared by every OpenAI compatible client (OpenAI, DeepSeek, local LLM servers).
+    * Connections are kept alive between questions instead of reconnecting for each one
+    * Uses HTTP/2 if the `h2` package is installed (`pip install httpx[http2]`)
+    '''
+    global __http_client
+    if __http_client is None or __http_client.is_closed:
+        try:
+            import h2
+            http2 = True
+        except ImportError:
+            http2 = False
+        __http_client = httpx.Client(limits=POOL_LIMITS, timeout=LONG_ANSWER_TIMEOUT, http2=http2)
+        print_lg(f"Created shared AI connection pool (HTTP/2: {http2}).")
+    return __http_client
+
+
+def get_timeout(question_type: str | None = None) -> httpx.Timeout:
+    '''
+    Function to get the request timeout for a `question_type`, "textarea" or `None` (free text like skills extraction) get the long timeout.
+    '''
+    return SHORT_ANSWER_TIMEOUT if question_type in ("text", "single_select", "multiple_select") else LONG_ANSWER_TIMEOUT
@@ -0,0 +1,75 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+from time import time
+
+from config.settings import cache_folder_path, ai_model_validation_ttl_days
+from modules.helpers import load_json_file, save_json_file
+
+
+__validated_models_file_path = (cache_folder_path + "/validated_ai_models.json").replace("//", "/")
+__validated_models: dict[str, float] | None = None
+
+
+def __get_key(provider: str, api_url: str | None, model: str) -> str:
+    return f"{provider.lower()}|{(api_url or '').rstrip('/')}|{model}"
+
+
+def __get_validated_models() -> dict[str, float]:
+    '''
+    Function to load the validated models from disk once, `{key: validated_at}`.
+    '''
+    global __validated_models
+    if __validated_models is None:
+        stored = load_json_file(__validated_models_file_path, {})
+        __validated_models = stored if isinstance(stored, dict) else {}
+    return __validated_models
+
+
+def is_model_validated(provider: str, api_url: str | None, model: str) -> bool:
+    '''
+    Function to check if `model` of `provider` at `api_url` was found in the models list within the last `ai_model_validation_ttl_days`.
+    '''
+    if ai_model_validation_ttl_days <= 0:
+        return False
+    validated_at = __get_validated_models().get(__get_key(provider, api_url, model))
+    try:
+        return validated_at is not None and time() - float(validated_at) <= ai_model_validation_ttl_days * 86400
+    except (TypeError, ValueError):
+        return False
+
+
+def remember_validated_model(provider: str, api_url: str | None, model: str) -> None:
+    '''
+    Function to remember that `model` of `provider` at `api_url` exists, so the models list isn't fetched again on the next start.
+    '''
+    if ai_model_validation_ttl_days <= 0:
+        return
+    validated_models = __get_validated_models()
+    validated_models[__get_key(provider, api_url, model)] = time()
+    save_json_file(__validated_models_file_path, validated_models)
+
+
+def forget_validated_model(provider: str, api_url: str | None, model: str) -> bool:
+    '''
+    Function to forget a validated model, Eg: when a completion with it fails.
+    * Returns `True` if it was remembered, so the caller knows validation was skipped and should be done now
+    '''
+    validated_models = __get_validated_models()
+    if validated_models.pop(__get_key(provider, api_url, model), None) is None:
+        return False
+    save_json_file(__validated_models_file_path, validated_models)
+    return True
@@ -23,9 +23,11 @@ from config.search import security_clearance, did_masters
 
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.model_cache import is_model_validated, remember_validated_model, forget_validated_model
+from modules.ai.http_pool import get_http_client, get_timeout
 
 from pyautogui import confirm
-from openai import OpenAI
+from openai import OpenAI, NotFoundError
 from openai.types.model import Model
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from typing import Iterator, Literal
@@ -79,15 +81,13 @@ def ai_create_openai_client() -> OpenAI:
         if not use_AI:
             raise ValueError("AI is not enabled! Please enable it by setting `use_AI = True` in `secrets.py` in `config` folder.")
         
-        client = OpenAI(base_url=llm_api_url, api_key=llm_api_key)
-
-        models = ai_get_models_list(client)
-        if "error" in models:
-            raise ValueError(models[1])
-        if len(models) == 0:
-            raise ValueError("No models are available!")
-        if llm_model not in [model.id for model in models]:
-            raise ValueError(f"Model `{llm_model}` is not found!")
+        client = OpenAI(base_url=llm_api_url, api_key=llm_api_key, http_client=get_http_client())
+
+        if is_model_validated("openai", llm_api_url, llm_model):
+            print_lg(f"Model `{llm_model}` was found recently, skipping models list check.")
+        else:
+            ai_validate_model(client)
+            remember_validated_model("openai", llm_api_url, llm_model)
         
         print_lg("---- SUCCESSFULLY CREATED OPENAI CLIENT! ----")
         print_lg(f"Using API URL: {llm_api_url}")
@@ -100,6 +100,22 @@ def ai_create_openai_client() -> OpenAI:
         ai_error_alert(f"Error occurred while creating OpenAI client. {apiCheckInstructions}", e)
 
 
+# Function to check if the configured model is available
+def ai_validate_model(client: OpenAI) -> None:
+    """
+    Function to check if `llm_model` is in the models list of the API.
+    * Takes in `client` of type `OpenAI`
+    * Raises a `ValueError` if the models list can't be fetched or the model is not in it
+    """
+    models = ai_get_models_list(client)
+    if "error" in models:
+        raise ValueError(models[1])
+    if len(models) == 0:
+        raise ValueError("No models are available!")
+    if llm_model not in [model.id for model in models]:
+        raise ValueError(f"Model `{llm_model}` is not found!")
+
+
 # Function to close an OpenAI client
 def ai_close_openai_client(client: OpenAI) -> None:
     """
@@ -148,7 +164,7 @@ def model_supports_temperature(model_name: str) -> bool:
     return model_name in ["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
 
 # Function to get chat completion from OpenAI API
-def ai_completion(client: OpenAI, messages: list[dict], response_format: dict = None, temperature: float = 0, stream: bool = stream_output) -> dict | ValueError:
+def ai_completion(client: OpenAI, messages: list[dict], response_format: dict = None, temperature: float = 0, stream: bool = stream_output, question_type: str | None = None) -> dict | ValueError:
     """
     Function that completes a chat and prints and formats the results of the OpenAI API calls.
     * Takes in `client` of type `OpenAI`
@@ -156,18 +172,29 @@ def ai_completion(client: OpenAI, messages: list[dict], response_format: dict =
     * Takes in `response_format` of type `dict` for JSON representation, default is `None`
     * Takes in `temperature` of type `float` for temperature, default is `0`
     * Takes in `stream` of type `bool` to indicate if it's a streaming call or not
+    * Takes in `question_type` of type `str` to pick the request timeout, short for single line answers, default is `None` (long)
     * Returns a `dict` object representing JSON response, will try to convert to JSON if `response_format` is given
     """
     if not client: raise ValueError("Client is not available!")
 
-    params = {"model": llm_model, "messages": messages, "stream": stream}
+    params = {"model": llm_model, "messages": messages, "stream": stream, "timeout": get_timeout(question_type)}
 
     if model_supports_temperature(llm_model):
         params["temperature"] = temperature
     if response_format and llm_spec in ["openai", "openai-like"]:
         params["response_format"] = response_format
 
-    completion = client.chat.completions.create(**params)
+    try:
+        completion = client.chat.completions.create(**params)
+    except Exception as e:
+        # Models list check was skipped at start-up, do it now if the model wasn't found (not on timeouts, rate limits, ...)
+        if (isinstance(e, NotFoundError) or getattr(e, "status_code", None) == 404) and forget_validated_model("openai", llm_api_url, llm_model):
+            try:
+                ai_validate_model(client)
+                remember_validated_model("openai", llm_api_url, llm_model)
+            except Exception as validation_error:
+                critical_error_log(f'Model "{llm_model}" is not available!', validation_error)
+        raise
 
     result = ""
     
@@ -248,7 +275,7 @@ def ai_answer_question(
 
         messages = [{"role": "user", "content": prompt}]
         print_lg("Prompt we are passing to AI: ", prompt)
-        response =  ai_completion(client, messages, stream=stream)
+        response =  ai_completion(client, messages, stream=stream, question_type=question_type)
         # print_lg("Response from AI: ", response)
         return response
     except Exception as e:
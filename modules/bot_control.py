@@ -0,0 +1,89 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import os
+import sys
+import subprocess
+import threading
+
+
+'''
+The bot process started from the dashboard. The dashboard serves requests from many threads at once,
+so every change goes through `__lock`, Eg: two "Start" clicks at the same time still start one bot.
+'''
+__bot_process: subprocess.Popen | None = None
+__log_handle = None
+__lock = threading.Lock()
+
+
+def __close_log() -> None:
+    global __log_handle
+    if __log_handle is not None:
+        __log_handle.close()
+        __log_handle = None
+
+
+def is_bot_running() -> bool:
+    '''
+    Function to check if the bot started from the dashboard is still running.
+    '''
+    process = __bot_process
+    return process is not None and process.poll() is None
+
+
+def start_bot(script_dir: str, log_file: str) -> int | None:
+    '''
+    Function to start `runAiBot.py` of `script_dir` in a new process, with its output written to `log_file` (replaced).
+    * Returns the process id, or `None` if the bot is already running
+    '''
+    global __bot_process, __log_handle
+    with __lock:
+        if is_bot_running():
+            return None
+        __close_log()
+        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        __log_handle = open(log_file, "w")
+        try:
+            # Unbuffered, so each line reaches the log file (and the live stream) as soon as it's printed
+            __bot_process = subprocess.Popen(
+                [sys.executable, "-u", "runAiBot.py"],
+                cwd=script_dir,
+                env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                stdout=__log_handle,
+                stderr=subprocess.STDOUT,
+                text=True,
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
+            )
+        except Exception:
+            __close_log()
+            raise
+        return __bot_process.pid
+
+
+def stop_bot() -> bool:
+    '''
+    Function to stop the bot started from the dashboard.
+    * Returns `False` if there was no bot to stop
+    '''
+    global __bot_process
+    with __lock:
+        if __bot_process is None:
+            return False
+        if __bot_process.poll() is None:
+            __bot_process.terminate()
+        __bot_process = None
+        __close_log()
+        return True
@@ -0,0 +1,190 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import os
+import json
+import sqlite3
+
+from time import time
+
+from config.settings import logs_folder_path
+
+
+'''
+The bot runs in its own process, it publishes its counters and what it's doing in a one row SQLite table
+that the dashboard (app.py) reads, instead of parsing the logs.
+The outcome of every job is also kept (`job_outcomes`), with running totals per search term (`term_rollups`) updated on each insert.
+WAL journal mode lets the dashboard read while the bot writes without either of them waiting.
+'''
+status_db_path = (logs_folder_path + "/bot_status.db").replace("//", "/")
+
+__connection: sqlite3.Connection | None = None
+__status: dict = {}
+
+
+def __get_connection() -> sqlite3.Connection | None:
+    global __connection
+    if __connection is None:
+        try:
+            os.makedirs(os.path.dirname(status_db_path) or ".", exist_ok=True)
+            __connection = sqlite3.connect(status_db_path, timeout=1, isolation_level=None)
+            __connection.execute("PRAGMA journal_mode=WAL")
+            __connection.execute("PRAGMA synchronous=NORMAL")
+            __connection.execute("CREATE TABLE IF NOT EXISTS status (id INTEGER PRIMARY KEY CHECK (id = 1), data TEXT NOT NULL, updated_at REAL NOT NULL)")
+            __connection.execute("CREATE TABLE IF NOT EXISTS job_outcomes (job_id TEXT, search_term TEXT, outcome TEXT NOT NULL, secs REAL NOT NULL, finished_at REAL NOT NULL)")
+            __connection.execute("CREATE INDEX IF NOT EXISTS job_outcomes_secs ON job_outcomes (outcome, secs)")
+            __connection.execute("CREATE TABLE IF NOT EXISTS term_rollups (search_term TEXT PRIMARY KEY, jobs INTEGER NOT NULL, applied INTEGER NOT NULL, external INTEGER NOT NULL, failed INTEGER NOT NULL, skipped INTEGER NOT NULL, apply_secs REAL NOT NULL)")
+        except Exception as e:
+            print(f'Failed to open bot status database "{status_db_path}"!', e)
+            __connection = None
+    return __connection
+
+
+def __write_status() -> None:
+    connection = __get_connection()
+    if connection is None:
+        return
+    now = time()
+    __status["updated_at"] = now
+    try:
+        connection.execute("INSERT OR REPLACE INTO status (id, data, updated_at) VALUES (1, ?, ?)", (json.dumps(__status, default=str), now))
+    except Exception as e:
+        # Dashboard is only informative, never stop applying because of it
+        print("Failed to publish bot status!", e)
+
+
+def start_status() -> None:
+    '''
+    Function to reset the published status when the bot starts.
+    '''
+    __status.clear()
+    now = time()
+    __status.update({
+        "pid": os.getpid(),
+        "started_at": now,
+        "phase": "starting",
+        "phase_started_at": now,
+        "last_step": None,
+        "step_timings": {},
+    })
+    __write_status()
+
+
+def publish_status(phase: str | None = None, **fields) -> None:
+    '''
+    Function to publish the bot's current `phase` (Eg: "searching", "applying") and any changed `fields` (counters, search term, page, job id, ...).
+    * When `phase` changes, how long the previous one took is recorded in `last_step` and averaged per phase in `step_timings`
+    '''
+    now = time()
+    if phase and phase != __status.get("phase"):
+        previous = __status.get("phase")
+        if previous:
+            secs = round(now - __status.get("phase_started_at", now), 2)
+            __status["last_step"] = {"phase": previous, "secs": secs}
+            timing = __status.setdefault("step_timings", {}).setdefault(previous, {"count": 0, "total_secs": 0.0, "avg_secs": 0.0})
+            timing["count"] += 1
+            timing["total_secs"] = round(timing["total_secs"] + secs, 2)
+            timing["avg_secs"] = round(timing["total_secs"] / timing["count"], 2)
+        __status["phase"] = phase
+        __status["phase_started_at"] = now
+    __status.update(fields)
+    __write_status()
+
+
+JOB_OUTCOMES = ("applied", "external", "failed", "skipped")
+
+
+def record_job_outcome(job_id: str | None, search_term: str | None, outcome: str, secs: float) -> None:
+    '''
+    Function to record how a job ended, `outcome` is one of `JOB_OUTCOMES`, and `secs` how long the bot spent on it.
+    '''
+    connection = __get_connection()
+    if connection is None or outcome not in JOB_OUTCOMES:
+        return
+    search_term = search_term or ""
+    counts = {name: int(name == outcome) for name in JOB_OUTCOMES}
+    apply_secs = secs if outcome in ("applied", "external") else 0.0
+    try:
+        with connection:
+            connection.execute("BEGIN")
+            connection.execute("INSERT INTO job_outcomes (job_id, search_term, outcome, secs, finished_at) VALUES (?, ?, ?, ?, ?)", (job_id, search_term, outcome, secs, time()))
+            connection.execute(
+                """INSERT INTO term_rollups (search_term, jobs, applied, external, failed, skipped, apply_secs) VALUES (?, 1, ?, ?, ?, ?, ?)
+                ON CONFLICT(search_term) DO UPDATE SET jobs = jobs + 1, applied = applied + excluded.applied, external = external + excluded.external,
+                failed = failed + excluded.failed, skipped = skipped + excluded.skipped, apply_secs = apply_secs + excluded.apply_secs""",
+                (search_term, counts["applied"], counts["external"], counts["failed"], counts["skipped"], apply_secs),
+            )
+    except Exception as e:
+        print("Failed to record job outcome!", e)
+
+
+def __read(query: str, parameters: tuple = ()) -> list[tuple]:
+    if not os.path.exists(status_db_path):
+        return []
+    try:
+        connection = sqlite3.connect(f"file:{status_db_path}?mode=ro", uri=True, timeout=1)
+        try:
+            return connection.execute(query, parameters).fetchall()
+        finally:
+            connection.close()
+    except sqlite3.Error:
+        # Eg: tables of an older version of the database not created yet
+        return []
+
+
+def read_term_rollups() -> list[dict]:
+    '''
+    Function to get the totals per search term, most searched first.
+    * `success_ratio` is applied plus external over all jobs seen for the term
+    '''
+    rollups = []
+    for search_term, jobs, applied, external, failed, skipped, apply_secs in __read("SELECT search_term, jobs, applied, external, failed, skipped, apply_secs FROM term_rollups ORDER BY jobs DESC"):
+        successful = applied + external
+        rollups.append({
+            "search_term": search_term,
+            "jobs": jobs,
+            "applied": applied,
+            "external": external,
+            "failed": failed,
+            "skipped": skipped,
+            "success_ratio": round(successful / jobs, 3) if jobs else 0.0,
+            "avg_secs_per_application": round(apply_secs / successful, 1) if successful else None,
+        })
+    return rollups
+
+
+def read_median_application_secs() -> float | None:
+    '''
+    Function to get the median time the bot spent on a job it applied to, read from the `(outcome, secs)` index.
+    '''
+    count = __read("SELECT COUNT(*) FROM job_outcomes WHERE outcome IN ('applied', 'external')")
+    if not count or not count[0][0]:
+        return None
+    count = count[0][0]
+    middle = __read(
+        "SELECT secs FROM job_outcomes WHERE outcome IN ('applied', 'external') ORDER BY secs LIMIT ? OFFSET ?",
+        (2 - count % 2, (count - 1) // 2),
+    )
+    return round(sum(secs for secs, in middle) / len(middle), 1) if middle else None
+
+
+def read_status() -> dict | None:
+    '''
+    Function to read the status last published by the bot, opens the database read-only.
+    * Returns the status or `None` if the bot never published one
+    '''
+    rows = __read("SELECT data FROM status WHERE id = 1")
+    return json.loads(rows[0][0]) if rows else None
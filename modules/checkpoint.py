@@ -0,0 +1,75 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import os
+
+from time import time
+
+from config.settings import cache_folder_path
+from modules.helpers import load_json_file, save_json_file, print_lg
+
+
+__checkpoint_file_path = (cache_folder_path + "/checkpoint.json").replace("//", "/")
+
+
+def load_checkpoint(search_terms: list[str]) -> dict | None:
+    '''
+    Function to load the checkpoint of an interrupted run.
+    * Ignored if it was saved for a different set of `search_terms`
+    * Returns `{"search_terms": list, "term_index": int, "page": int, "last_job_id": str, "processed_job_ids": list, "counters": dict, "saved_at": float}` or `None`
+    '''
+    checkpoint = load_json_file(__checkpoint_file_path, None)
+    if not isinstance(checkpoint, dict):
+        return None
+    try:
+        if sorted(checkpoint["search_terms"]) != sorted(search_terms):
+            print_lg("Search terms changed since the last checkpoint, starting from the beginning.")
+            return None
+        checkpoint["term_index"] = int(checkpoint.get("term_index", 0))
+        checkpoint["page"] = max(1, int(checkpoint.get("page", 1)))
+        checkpoint["processed_job_ids"] = list(checkpoint.get("processed_job_ids", []))
+        checkpoint["counters"] = dict(checkpoint.get("counters", {}))
+    except (KeyError, TypeError, ValueError) as e:
+        print_lg("Checkpoint is corrupted, starting from the beginning.", e)
+        return None
+    return checkpoint
+
+
+def save_checkpoint(search_terms: list[str], term_index: int, page: int, last_job_id: str | None, processed_job_ids: list[str], counters: dict[str, int]) -> None:
+    '''
+    Function to save the progress of the current run, so it can be resumed with `resume_from_checkpoint = True` if the bot is interrupted.
+    '''
+    save_json_file(__checkpoint_file_path, {
+        "search_terms": search_terms,
+        "term_index": term_index,
+        "page": page,
+        "last_job_id": last_job_id,
+        "processed_job_ids": processed_job_ids,
+        "counters": counters,
+        "saved_at": time(),
+    })
+
+
+def clear_checkpoint() -> None:
+    '''
+    Function to delete the checkpoint once a run finishes cleanly.
+    '''
+    try:
+        os.remove(__checkpoint_file_path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print_lg(f'Failed to delete checkpoint "{__checkpoint_file_path}"!', e)
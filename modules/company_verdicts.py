@@ -0,0 +1,92 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+from time import time
+from hashlib import sha1
+
+from config.settings import cache_folder_path, company_verdict_ttl_days
+from modules.helpers import load_json_file, save_json_file, print_lg
+
+
+__company_verdicts_file_path = (cache_folder_path + "/company_verdicts.json").replace("//", "/")
+__company_verdicts: dict | None = None
+
+
+def __get_company_verdicts() -> dict:
+    '''
+    Function to load the company verdicts cache from disk once.
+    * Stored as `{"fingerprint": str, "companies": {company_key: {"company", "allowed", "matched_word", "checked_at"}}}`
+    '''
+    global __company_verdicts
+    if __company_verdicts is None:
+        stored = load_json_file(__company_verdicts_file_path, {})
+        if not isinstance(stored, dict) or not isinstance(stored.get("companies"), dict):
+            stored = {"fingerprint": "", "companies": {}}
+        __company_verdicts = stored
+    return __company_verdicts
+
+
+def get_company_key(company: str) -> str:
+    '''
+    Function to get the cache key of a `company` name as shown in job cards.
+    '''
+    return " ".join((company or "").split()).lower()
+
+
+def use_company_word_lists(good_words: list[str], bad_words: list[str]) -> None:
+    '''
+    Function to bind the cache to the current `about_company_good_words` and `about_company_bad_words`.
+    * Verdicts learned with different word lists are forgotten, since they may no longer hold
+    '''
+    fingerprint = sha1(repr((sorted(word.lower() for word in good_words), sorted(word.lower() for word in bad_words))).encode("utf-8")).hexdigest()
+    verdicts = __get_company_verdicts()
+    if verdicts.get("fingerprint") == fingerprint:
+        return
+    if verdicts["companies"]:
+        print_lg(f"About company word lists changed, forgetting {len(verdicts['companies'])} learned company verdicts.")
+    verdicts["fingerprint"] = fingerprint
+    verdicts["companies"] = {}
+    save_json_file(__company_verdicts_file_path, verdicts)
+
+
+def get_company_verdict(company: str) -> dict | None:
+    '''
+    Function to get the learned verdict for `company`.
+    * Returns `{"company": str, "allowed": bool, "matched_word": str | None, "checked_at": float}` or `None` if unknown or expired
+    '''
+    key = get_company_key(company)
+    if company_verdict_ttl_days <= 0 or not key or key == "unknown company":
+        return None
+    companies = __get_company_verdicts()["companies"]
+    verdict = companies.get(key)
+    if verdict is None:
+        return None
+    if time() - float(verdict.get("checked_at", 0)) > company_verdict_ttl_days * 86400:
+        del companies[key]
+        return None
+    return verdict
+
+
+def record_company_verdict(company: str, allowed: bool, matched_word: str | None = None) -> None:
+    '''
+    Function to remember if `company` is `allowed` or blocked, and the `matched_word` that decided it.
+    '''
+    key = get_company_key(company)
+    if company_verdict_ttl_days <= 0 or not key or key == "unknown company":
+        return
+    verdicts = __get_company_verdicts()
+    verdicts["companies"][key] = {"company": company, "allowed": allowed, "matched_word": matched_word, "checked_at": time()}
+    save_json_file(__company_verdicts_file_path, verdicts)
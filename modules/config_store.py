@@ -0,0 +1,158 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import os
+import ast
+import json
+import hashlib
+import tempfile
+import threading
+import importlib.util
+
+from contextlib import contextmanager
+
+
+'''
+The dashboard reads `config/*.py` through here instead of executing them on every request.
+A file is parsed once and kept in memory with its modification time and size, the next read only calls `os.stat()`
+and parses it again if either changed (Eg: the file was saved from the UI, by another process or edited by hand).
+'''
+config_folder_path = "config/"
+
+__cache: dict[str, dict] = {}
+__lock = threading.Lock()
+__file_locks: dict[str, threading.Lock] = {}
+
+
+def parse_config_source(source: str, filename: str = "<config>") -> dict:
+    '''
+    Function to get the public top level variables of a config file's `source` without executing it.
+    * Raises `ValueError` if a value is not a plain literal (Eg: `os.getenv(...)`), such files have to be executed
+    '''
+    config = {}
+    for node in ast.parse(source, filename).body:
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets, value = [node.target], node.value
+        elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            continue # Docstrings
+        else:
+            raise ValueError(f"{filename} has a statement that is not a plain assignment")
+        names = [target.id for target in targets if isinstance(target, ast.Name)]
+        if len(names) != len(targets):
+            raise ValueError(f"{filename} assigns to something other than a variable")
+        literal = ast.literal_eval(value)
+        for name in names:
+            if not name.startswith("_"):
+                config[name] = literal
+    return config
+
+
+def __execute_config(filepath: str) -> dict:
+    '''
+    Function to get the public variables of a config file by executing it, only for files `parse_config_source()` can't read.
+    '''
+    config = {}
+    spec = importlib.util.spec_from_file_location("config_module", filepath)
+    if spec and spec.loader:
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for attr in dir(module):
+            if not attr.startswith("_"):
+                value = getattr(module, attr)
+                if not callable(value) and type(value).__name__ != "module":
+                    config[attr] = value
+    return config
+
+
+def __load(filepath: str) -> dict:
+    with open(filepath, "r", encoding="utf-8") as file:
+        source = file.read()
+    try:
+        return parse_config_source(source, filepath)
+    except (ValueError, SyntaxError):
+        return __execute_config(filepath)
+
+
+def get_config(filename: str) -> tuple[dict, str | None]:
+    '''
+    Function to get the variables of `config/<filename>`, parsed again only if the file changed since the last call.
+    * Returns `(variables, etag)`, a copy the caller may change, and `etag` is `None` if the file doesn't exist
+    '''
+    filepath = config_folder_path + filename
+    with __lock:
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            __cache.pop(filepath, None)
+            return {}, None
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = __cache.get(filepath)
+        if cached is None or cached["key"] != key:
+            try:
+                values = __load(filepath)
+            except Exception as e:
+                print(f"Error reading {filename}: {e}")
+                values = cached["values"] if cached else {}
+            # From the values, not the file, so it also changes when an executed file reads something else (Eg: `.env`)
+            etag = hashlib.sha1(json.dumps(values, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+            cached = __cache[filepath] = {"key": key, "values": values, "etag": etag}
+        return dict(cached["values"]), cached["etag"]
+
+
+def forget_config(filename: str) -> None:
+    '''
+    Function to drop the cached variables of `config/<filename>`, Eg: when something it reads (like `.env`) changed but the file itself didn't.
+    '''
+    with __lock:
+        __cache.pop(config_folder_path + filename, None)
+
+
+@contextmanager
+def config_file_lock(filename: str):
+    '''
+    Context manager to hold `config/<filename>` while reading, changing and writing it back, so concurrent saves of the same file don't lose each other's changes.
+    '''
+    with __lock:
+        file_lock = __file_locks.setdefault(filename, threading.Lock())
+    with file_lock:
+        yield
+
+
+def write_config_file(filename: str, content: str) -> None:
+    '''
+    Function to replace `config/<filename>` with `content` in one step, so neither the bot nor the dashboard ever read a half written file.
+    * The cached variables of the file are dropped, the next `get_config()` parses the new content
+    '''
+    filepath = config_folder_path + filename
+    # Unique per call, two threads saving at once never write into the same temporary file
+    descriptor, temp_path = tempfile.mkstemp(dir=config_folder_path, prefix=f".{filename}.", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.write(content)
+        try:
+            os.chmod(temp_path, os.stat(filepath).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    forget_config(filename)
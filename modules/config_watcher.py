@@ -0,0 +1,116 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import os
+import sys
+import importlib
+
+from modules.helpers import print_lg, critical_error_log
+
+
+'''
+Config files the bot picks up while running, `{name: path}`. `name` is the module in `config/` and the `validate_<name>()` in `modules/validator.py`.
+Modules listed in `CONFIG_CONSUMERS` imported variables from them at start, those variables are updated too.
+'''
+WATCHED_CONFIGS = {
+    "questions": "config/questions.py",
+    "search": "config/search.py",
+}
+CONFIG_CONSUMERS = (
+    "modules.validator",
+    "modules.open_chrome",
+    "modules.resumes.extractor",
+    "modules.ai.openaiConnections",
+)
+
+__file_keys: dict[str, tuple[int, int] | None] = {}
+
+
+def __get_file_key(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def __public_values(module) -> dict:
+    return {name: value for name, value in vars(module).items() if not name.startswith("_") and type(value).__name__ != "module"}
+
+
+def watch_configs() -> None:
+    '''
+    Function to remember the current version of the watched config files, changes after this are reloaded by `reload_changed_configs()`.
+    '''
+    for name, path in WATCHED_CONFIGS.items():
+        __file_keys[name] = __get_file_key(path)
+
+
+def __validate(name: str, values: dict) -> None:
+    '''
+    Function to run `validate_<name>()` of `modules/validator.py` on `values`, the validator is left as it was if they are invalid.
+    '''
+    validator = sys.modules.get("modules.validator") or importlib.import_module("modules.validator")
+    previous = {key: vars(validator)[key] for key in values if key in vars(validator)}
+    vars(validator).update(values)
+    try:
+        getattr(validator, f"validate_{name}")()
+    except Exception:
+        for key in values:
+            if key in previous:
+                vars(validator)[key] = previous[key]
+            else:
+                vars(validator).pop(key, None)
+        raise
+
+
+def reload_changed_configs() -> dict[str, tuple[dict, dict]]:
+    '''
+    Function to reload the watched config files that changed on disk since they were last loaded, only costs an `os.stat()` per file if none did.
+    * Invalid files are reported and ignored until they change again, the bot keeps the values it has
+    * Returns `{name: (old values, new values)}` of the configs that were reloaded
+    '''
+    changed = {}
+    for name, path in WATCHED_CONFIGS.items():
+        file_key = __get_file_key(path)
+        if name not in __file_keys:
+            __file_keys[name] = file_key
+            continue
+        if file_key == __file_keys[name] or file_key is None:
+            continue
+        __file_keys[name] = file_key
+        module = sys.modules.get(f"config.{name}")
+        if module is None:
+            continue
+        old_values = __public_values(module)
+        try:
+            importlib.reload(module)
+            new_values = __public_values(module)
+            __validate(name, new_values)
+        except Exception as e:
+            vars(module).update(old_values)
+            critical_error_log(f'Ignored the changes to "{path}", keeping the previous values', e)
+            continue
+        for consumer_name in CONFIG_CONSUMERS:
+            consumer = sys.modules.get(consumer_name)
+            if consumer is None or consumer_name == "modules.validator":
+                continue
+            for key, value in new_values.items():
+                if key in vars(consumer) and old_values.get(key) is vars(consumer)[key]:
+                    vars(consumer)[key] = value
+        print_lg(f'Reloaded "{path}" without restarting.')
+        changed[name] = (old_values, new_values)
+    return changed
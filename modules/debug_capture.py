@@ -0,0 +1,163 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import io
+import gzip
+import base64
+import hashlib
+
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import logs_folder_path, screenshot_format, screenshot_quality, max_screenshots_per_run, max_page_snapshot_kb, page_snapshot_subtrees_only
+from modules.helpers import print_lg, critical_error_log, make_directories
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+# Single background thread, so the driver never waits for the disk
+__artifact_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-capture-writer")
+__screenshots_saved = 0
+__screenshot_names_by_hash: dict[str, str] = {}
+
+
+def __write_file(path: str, data: bytes) -> None:
+    '''
+    Function to write `data` to `path`, runs in the background writer thread.
+    '''
+    try:
+        make_directories([path])
+        with open(path, "wb") as file:
+            file.write(data)
+    except Exception as e:
+        critical_error_log(f'Failed to save "{path}"!', e)
+
+
+def write_in_background(path: str, data: bytes) -> None:
+    '''
+    Function to queue `data` to be written to `path` without blocking the caller.
+    '''
+    __artifact_writer.submit(__write_file, path, data)
+
+
+def get_image_hash(image: bytes) -> str:
+    '''
+    Function to get a perceptual hash (difference hash) of an `image`, so the same failure screen has the same hash even if its bytes differ slightly.
+    * Falls back to an exact SHA-1 of the bytes if Pillow isn't installed
+    '''
+    try:
+        from PIL import Image
+        pixels = list(Image.open(io.BytesIO(image)).convert("L").resize((9, 8)).getdata())
+        bits = "".join("1" if pixels[row * 9 + col] > pixels[row * 9 + col + 1] else "0" for row in range(8) for col in range(8))
+        return "dhash:" + f"{int(bits, 2):016x}"
+    except ImportError:
+        return "sha1:" + hashlib.sha1(image).hexdigest()
+    except Exception as e:
+        critical_error_log("Failed to hash screenshot, saving it anyway!", e)
+        return "sha1:" + hashlib.sha1(image).hexdigest()
+
+
+def capture_image(driver: WebDriver) -> tuple[bytes, str]:
+    '''
+    Function to capture the current page with the Chrome DevTools `Page.captureScreenshot` command in `screenshot_format`.
+    * Falls back to a regular PNG screenshot if DevTools commands are not available
+    * Returns `(image bytes, file extension)`
+    '''
+    params = {"format": screenshot_format}
+    if screenshot_format != "png":
+        params["quality"] = max(1, min(100, screenshot_quality))
+    try:
+        result = driver.execute_cdp_cmd("Page.captureScreenshot", params)
+        extension = "jpg" if screenshot_format == "jpeg" else screenshot_format
+        return base64.b64decode(result["data"]), extension
+    except Exception as e:
+        print_lg("DevTools screenshot failed, falling back to PNG screenshot.", e)
+        return driver.get_screenshot_as_png(), "png"
+
+
+def take_screenshot(driver: WebDriver, job_id: str, failedAt: str) -> str:
+    '''
+    Function to take a screenshot for debugging and save it in `logs/screenshots` in the background.
+    * Only `max_screenshots_per_run` screenshots are saved per run
+    * If the screen looks the same as an earlier screenshot, that screenshot's name is returned instead of saving a new one
+    * Returns screenshot name as String, or "Not Available"
+    '''
+    global __screenshots_saved
+    if __screenshots_saved >= max_screenshots_per_run:
+        print_lg(f"Screenshot quota of {max_screenshots_per_run} for this run is used up, skipping screenshot!")
+        return "Not Available"
+    try:
+        image, extension = capture_image(driver)
+    except Exception as e:
+        critical_error_log("Failed to take screenshot!", e)
+        return "Not Available"
+
+    image_hash = get_image_hash(image)
+    if image_hash in __screenshot_names_by_hash:
+        print_lg("Same screen as an earlier screenshot, not saving it again.")
+        return __screenshot_names_by_hash[image_hash]
+
+    screenshot_name = "{} - {} - {}.{}".format(job_id, failedAt, str(datetime.now()), extension)
+    path = logs_folder_path + "/screenshots/" + screenshot_name.replace(":", ".")
+    write_in_background(path.replace("//", "/"), image)
+    __screenshots_saved += 1
+    __screenshot_names_by_hash[image_hash] = screenshot_name
+    return screenshot_name
+
+
+PAGE_SUBTREES_SCRIPT = """
+const selectors = [
+    '.jobs-search-results-list', '.scaffold-layout__list',
+    '.jobs-search__job-details', '.jobs-details',
+    '.jobs-easy-apply-modal', '[role="dialog"]',
+];
+const subtrees = [];
+for (const selector of selectors) {
+    const element = document.querySelector(selector);
+    if (element && !subtrees.some(subtree => subtree.element.contains(element))) {
+        subtrees.push({selector: selector, element: element});
+    }
+}
+return subtrees.map(subtree => `<!-- ${subtree.selector} -->\\n${subtree.element.outerHTML}`).join('\\n\\n');
+"""
+
+
+def save_page_snapshot(driver: WebDriver, reason: str) -> str | None:
+    '''
+    Function to save the current page HTML for debugging as a gzip compressed file in `logs/snapshots`, in the background.
+    * Only the job list, job details and application dialog are saved if `page_snapshot_subtrees_only = True` (whole page if none of them are found)
+    * HTML is cut at `max_page_snapshot_kb` before compression
+    * Returns the snapshot id to reference in logs, or `None` if snapshots are disabled
+    '''
+    if max_page_snapshot_kb <= 0:
+        return None
+    html = ""
+    if page_snapshot_subtrees_only:
+        try:
+            html = driver.execute_script(PAGE_SUBTREES_SCRIPT) or ""
+        except Exception as e:
+            print_lg("Failed to get relevant parts of the page, saving whole page.", e)
+    if not html:
+        html = driver.page_source or ""
+
+    data = html.encode("utf-8")
+    limit = max_page_snapshot_kb * 1024
+    if len(data) > limit:
+        data = data[:limit] + f"\n<!-- [TRUNCATED {len(data) - limit} bytes] -->".encode("utf-8")
+    snapshot_id = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    header = f"<!-- {reason} | {driver.current_url} -->\n".encode("utf-8")
+    path = (logs_folder_path + "/snapshots/" + snapshot_id + ".html.gz").replace("//", "/")
+    write_in_background(path, gzip.compress(header + data))
+    return snapshot_id
@@ -21,6 +21,7 @@ import os
 import sys
 import json
 import pathlib
+import tempfile
 
 from time import sleep
 from random import randint
@@ -273,6 +274,50 @@ def convert_to_json(data) -> dict:
         return {"error": "Unable to parse the response as JSON", "data": data}
 
 
+def load_json_file(path: str, default: dict | list | None = None) -> dict | list | None:
+    '''
+    Function to read a JSON file written by `save_json_file()`.
+    * Returns `default` if the file is missing, empty or corrupted
+    '''
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        critical_error_log(f'Failed to read "{path}", ignoring its contents!', e)
+        return default
+
+
+def save_json_file(path: str, data: dict | list, private: bool = False) -> bool:
+    '''
+    Function to write `data` as JSON to `path` atomically (write to a temp file, then replace), so a crash mid-write never leaves a half written file behind.
+    * `private = True` creates the file readable only by the current user from the start (Eg: login cookies), it's never readable by others, not even for a moment
+    * Returns `True` if saved, else `False`
+    '''
+    try:
+        make_directories([path])
+        if private:
+            # mkstemp creates the temp file with 0600 permissions, which `os.replace` keeps
+            descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp")
+            file = os.fdopen(descriptor, "w", encoding="utf-8")
+        else:
+            temp_path = path + ".tmp"
+            file = open(temp_path, "w", encoding="utf-8")
+        try:
+            with file:
+                json.dump(data, file, ensure_ascii=False, default=str)
+            os.replace(temp_path, path)
+        except BaseException:
+            if private and os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return True
+    except Exception as e:
+        critical_error_log(f'Failed to save "{path}"!', e)
+        return False
+
+
 def truncate_for_csv(data, max_length: int = 131000, suffix: str = "...[TRUNCATED]") -> str:
     '''
     Function to truncate data for CSV writing to avoid field size limit errors.
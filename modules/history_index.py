@@ -0,0 +1,220 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import os
+import csv
+import threading
+
+from bisect import bisect_left, bisect_right
+
+
+# Job descriptions can be huge, same limit as the bot uses to write them
+csv.field_size_limit(1000000)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+SORT_FIELDS = {"date", "company", "title"}
+
+'''
+An index keeps only the summary columns the dashboard shows, never the big ones (About Job, Stack Trace, ...).
+`columns` maps the API field name to the CSV header, Eg: `{"Job_ID": "Job ID", "Title": "Title"}`
+`date_column` is the CSV header used by `date_from`, `date_to` and `sort=date`
+
+The bot only appends to the history files, so after the first read only the bytes appended since the last read are parsed.
+Each index remembers how many bytes it has consumed and where every row starts, and is rebuilt if the file shrank or was replaced.
+'''
+__indexes: dict[str, dict] = {}
+__lock = threading.Lock()
+
+
+def __new_index(stat: os.stat_result) -> dict:
+    return {"inode": stat.st_ino, "consumed": 0, "header": None, "header_bytes": b"", "rows": [], "offsets": [], "companies": set(), "sorted_companies": None}
+
+
+def __split_records(data: bytes) -> tuple[list[tuple[int, bytes]], int]:
+    '''
+    Function to split `data` into complete CSV records, a newline inside a quoted cell doesn't end a record.
+    * Returns `([(offset in data, record bytes), ...], bytes consumed)`, an incomplete last record is left for the next read
+    '''
+    records = []
+    record_start = 0
+    quotes = 0
+    position = 0
+    while True:
+        newline = data.find(b"\n", position)
+        if newline == -1:
+            break
+        quotes += data.count(b'"', position, newline)
+        position = newline + 1
+        # Even number of quotes so far means the newline is outside a quoted cell
+        if quotes % 2 == 0:
+            records.append((record_start, data[record_start:position]))
+            record_start = position
+            quotes = 0
+    return records, record_start
+
+
+def __read_appended_rows(csv_path: str, index: dict, columns: dict[str, str], date_column: str) -> None:
+    '''
+    Function to parse only the rows appended to `csv_path` since `index` last read it.
+    '''
+    with open(csv_path, "rb") as file:
+        file.seek(index["consumed"])
+        data = file.read()
+    records, consumed = __split_records(data)
+    base_offset = index["consumed"]
+    for record_offset, record in records:
+        values = next(csv.reader([record.decode("utf-8", errors="replace")]), [])
+        if index["header"] is None:
+            index["header"] = values
+            index["header_bytes"] = record
+            continue
+        if not values:
+            continue
+        row = dict(zip(index["header"], values))
+        summary = {field: row.get(header) or "" for field, header in columns.items()}
+        summary["_date"] = row.get(date_column) or ""
+        index["rows"].append(summary)
+        index["offsets"].append(base_offset + record_offset)
+        if summary.get("Company"):
+            index["companies"].add(summary["Company"])
+            index["sorted_companies"] = None
+    index["consumed"] = base_offset + consumed
+
+
+def __was_replaced(csv_path: str, index: dict, stat: os.stat_result) -> bool:
+    '''
+    Function to check if `csv_path` was truncated, rotated or rewritten since `index` read it.
+    '''
+    if stat.st_size < index["consumed"] or stat.st_ino != index["inode"]:
+        return True
+    if index["header_bytes"]:
+        with open(csv_path, "rb") as file:
+            return file.read(len(index["header_bytes"])) != index["header_bytes"]
+    return False
+
+
+def get_index(csv_path: str, columns: dict[str, str], date_column: str) -> dict:
+    '''
+    Function to get the index of `csv_path`, reading only what was appended since the last call.
+    * Returns `{"rows": list[dict], "offsets": list[int], "companies": list[str], ...}`, `offsets` are the byte offsets where each row starts
+    '''
+    with __lock:
+        try:
+            stat = os.stat(csv_path)
+        except FileNotFoundError:
+            __indexes.pop(csv_path, None)
+            return {"rows": [], "offsets": [], "companies": []}
+        index = __indexes.get(csv_path)
+        if index is None or __was_replaced(csv_path, index, stat):
+            index = __indexes[csv_path] = __new_index(stat)
+        if stat.st_size > index["consumed"]:
+            __read_appended_rows(csv_path, index, columns, date_column)
+        if index["sorted_companies"] is None:
+            index["sorted_companies"] = sorted(index["companies"], key=str.lower)
+        return {"rows": index["rows"], "offsets": index["offsets"], "companies": index["sorted_companies"]}
+
+
+def __parse_limit(limit: str | int | None) -> int:
+    try:
+        return max(1, min(MAX_PAGE_SIZE, int(limit)))
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+
+
+def __parse_cursor(cursor: str | int | None) -> int | None:
+    try:
+        cursor = int(cursor)
+    except (TypeError, ValueError):
+        return None
+    return cursor if cursor >= 0 else None
+
+
+def query_history(
+    csv_path: str, columns: dict[str, str], date_column: str,
+    limit: str | int | None = None, cursor: str | int | None = None,
+    q: str | None = None, company: str | None = None,
+    date_from: str | None = None, date_to: str | None = None,
+    sort: str | None = None,
+) -> dict:
+    '''
+    Function to get one page of a history CSV.
+    * `q` matches Job ID, Title or Company (case-insensitive), `company` matches Company exactly (case-insensitive)
+    * `date_from` and `date_to` are inclusive "YYYY-MM-DD" dates, rows without a date (Eg: "Pending") are left out when either is given
+    * `sort` is one of "date", "company" or "title", prefix with "-" for descending. Default is "-date" (newest first)
+    * `cursor` is the `next_cursor` of the previous page, the position in the file of its last row, so rows appended meanwhile don't shift the pages
+    * Returns `{"items": list[dict], "total": int, "next_cursor": str | None, "companies": list[str]}`
+    '''
+    index = get_index(csv_path, columns, date_column)
+    rows = index["rows"]
+    # Positions of the matching rows in the file, ascending, every row if there are no filters
+    positions = range(len(rows))
+
+    q = (q or "").strip().lower()
+    company = (company or "").strip().lower()
+    date_from = (date_from or "").strip()[:10]
+    date_to = (date_to or "").strip()[:10]
+    if q or company or date_from or date_to:
+        def matches(row: dict) -> bool:
+            if q and q not in row.get("Job_ID", "").lower() and q not in row.get("Title", "").lower() and q not in row.get("Company", "").lower():
+                return False
+            if company and row.get("Company", "").lower() != company:
+                return False
+            if date_from or date_to:
+                day = row["_date"][:10]
+                if not day[:4].isdigit() or (date_from and day < date_from) or (date_to and day > date_to):
+                    return False
+            return True
+        positions = [position for position in positions if matches(rows[position])]
+
+    sort = (sort or "-date").strip()
+    descending = sort.startswith("-")
+    field = sort.lstrip("-+")
+    if field not in SORT_FIELDS:
+        field, descending = "date", True
+
+    total = len(positions)
+    limit = __parse_limit(limit)
+    cursor = __parse_cursor(cursor)
+    if cursor is not None and cursor >= len(rows):
+        cursor = None # From before the file was replaced
+    if field == "date":
+        # Rows are appended in date order, so only the requested window is copied
+        if descending:
+            end = bisect_left(positions, cursor) if cursor is not None else total
+            page = positions[max(0, end - limit):end][::-1]
+            has_more = end > limit
+        else:
+            start = bisect_right(positions, cursor) if cursor is not None else 0
+            page = positions[start:start + limit]
+            has_more = start + limit < total
+    else:
+        key = field.capitalize()
+        # Position breaks ties, so every row has its own place to continue after
+        sort_key = lambda position: (rows[position].get(key, "").lower(), position)
+        remaining = positions
+        if cursor is not None:
+            after = sort_key(cursor)
+            remaining = [position for position in positions if (sort_key(position) < after if descending else sort_key(position) > after)]
+        page = sorted(remaining, key=sort_key, reverse=descending)[:limit]
+        has_more = len(remaining) > limit
+    items = [{field: value for field, value in rows[position].items() if not field.startswith("_")} for position in page]
+    return {
+        "items": items,
+        "total": total,
+        "next_cursor": str(page[-1]) if has_more and page else None,
+        "companies": index["companies"],
+    }
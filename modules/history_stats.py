@@ -0,0 +1,76 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import threading
+
+from collections import Counter
+from datetime import date, timedelta
+
+from modules.history_index import get_index
+
+
+'''
+Rollups of a history CSV (rows per day, per company and per failure reason), built on top of `modules/history_index.py`.
+Each rollup remembers how many rows of the index it has counted, so only rows appended since the last call are added.
+It's rebuilt from scratch only when the index was (the file was truncated or replaced).
+'''
+__rollups: dict[str, dict] = {}
+__lock = threading.Lock()
+
+
+def __new_rollup(rows: list) -> dict:
+    return {"rows": rows, "counted": 0, "daily": Counter(), "companies": Counter(), "reasons": Counter()}
+
+
+def get_rollup(csv_path: str, columns: dict[str, str], date_column: str) -> dict:
+    '''
+    Function to get the rollup of `csv_path`, counting only the rows appended since the last call.
+    * Returns `{"total": int, "daily": Counter, "companies": Counter, "reasons": Counter}` (copies), days are "YYYY-MM-DD" or "Unknown"
+    '''
+    rows = get_index(csv_path, columns, date_column)["rows"]
+    with __lock:
+        rollup = __rollups.get(csv_path)
+        if rollup is None or rollup["rows"] is not rows or rollup["counted"] > len(rows):
+            rollup = __rollups[csv_path] = __new_rollup(rows)
+        new_rows = rows[rollup["counted"]:]
+        for row in new_rows:
+            day = row["_date"][:10]
+            rollup["daily"][day if day[:4].isdigit() else "Unknown"] += 1
+            if row.get("Company"):
+                rollup["companies"][row["Company"]] += 1
+            if row.get("Assumed_Reason"):
+                rollup["reasons"][row["Assumed_Reason"]] += 1
+        rollup["counted"] += len(new_rows)
+        # Copies, another request may be adding rows to the rollup while this one is answered
+        return {"total": rollup["counted"], "daily": rollup["daily"].copy(), "companies": rollup["companies"].copy(), "reasons": rollup["reasons"].copy()}
+
+
+def daily_series(daily: Counter, days: int) -> list[dict]:
+    '''
+    Function to get the counts of the last `days` days, oldest first, including days without rows.
+    '''
+    today = date.today()
+    return [
+        {"date": day, "count": daily.get(day, 0)}
+        for day in ((today - timedelta(days=offset)).isoformat() for offset in range(days - 1, -1, -1))
+    ]
+
+
+def top_counts(counter: Counter, key: str, limit: int = 10) -> list[dict]:
+    '''
+    Function to get the `limit` most common entries of `counter` as `[{key: value, "count": int}, ...]`.
+    '''
+    return [{key: value, "count": count} for value, count in counter.most_common(limit)]
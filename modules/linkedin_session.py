@@ -0,0 +1,140 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import os
+
+from time import time
+
+from config.settings import cache_folder_path, remember_login, login_cookies_file_path
+from modules.helpers import load_json_file, save_json_file, print_lg, critical_error_log
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+SESSION_COOKIE_NAME = "li_at"
+LINKEDIN_URLS = ["https://www.linkedin.com/", "https://linkedin.com/"]
+# Fields accepted by DevTools `Network.setCookies`
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+__cookies_file_path = os.path.expanduser(login_cookies_file_path)
+# Older versions kept the cookies with the caches in "logs/", which is shared in bug reports
+__legacy_cookies_file_path = (cache_folder_path + "/linkedin_cookies.json").replace("//", "/")
+
+
+def get_linkedin_cookies(driver: WebDriver) -> list[dict] | None:
+    '''
+    Function to get all LinkedIn cookies with a single DevTools `Network.getCookies` call, works from any page.
+    * Falls back to `driver.get_cookies()` (only works while on a LinkedIn page) if DevTools commands are not available
+    * Returns the cookies or `None` if they couldn't be read
+    '''
+    try:
+        return driver.execute_cdp_cmd("Network.getCookies", {"urls": LINKEDIN_URLS}).get("cookies", [])
+    except Exception:
+        pass
+    try:
+        if "linkedin.com" not in (driver.current_url or ""):
+            return None
+        return driver.get_cookies()
+    except Exception as e:
+        print_lg("Failed to read LinkedIn cookies!", e)
+        return None
+
+
+def is_cookie_alive(cookie: dict) -> bool:
+    '''
+    Function to check if a `cookie` has not expired. Session cookies (no expiry) are alive.
+    '''
+    expires = cookie.get("expires", cookie.get("expiry", -1))
+    try:
+        return expires is None or float(expires) <= 0 or float(expires) > time()
+    except (TypeError, ValueError):
+        return True
+
+
+def has_session_cookie(driver: WebDriver) -> bool | None:
+    '''
+    Function to check for LinkedIn's login session cookie `li_at`.
+    * Returns `True` if present, `False` if not, or `None` if cookies couldn't be read
+    '''
+    cookies = get_linkedin_cookies(driver)
+    if cookies is None:
+        return None
+    return any(cookie.get("name") == SESSION_COOKIE_NAME and cookie.get("value") and is_cookie_alive(cookie) for cookie in cookies)
+
+
+def save_session_cookies(driver: WebDriver) -> None:
+    '''
+    Function to save the LinkedIn cookies in `cache_folder_path`, readable only by the current user, so the next run can skip logging in.
+    '''
+    if not remember_login:
+        return
+    cookies = get_linkedin_cookies(driver)
+    if not cookies or not any(cookie.get("name") == SESSION_COOKIE_NAME for cookie in cookies):
+        return
+    if save_json_file(__cookies_file_path, cookies, private=True):
+        __remove_legacy_cookies()
+
+
+def __remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print_lg(f'Failed to delete "{path}"!', e)
+
+
+def __remove_legacy_cookies() -> None:
+    if os.path.abspath(__legacy_cookies_file_path) != os.path.abspath(__cookies_file_path):
+        __remove_file(__legacy_cookies_file_path)
+
+
+def forget_session_cookies() -> None:
+    '''
+    Function to delete the saved LinkedIn cookies, Eg: when they no longer log in.
+    '''
+    __remove_file(__cookies_file_path)
+    __remove_legacy_cookies()
+
+
+def restore_session_cookies(driver: WebDriver) -> bool:
+    '''
+    Function to load the LinkedIn cookies saved by `save_session_cookies()` into the browser.
+    * Returns `True` if a live session cookie was restored, else `False`
+    '''
+    if not remember_login:
+        # Don't leave a session behind from when it was turned on
+        forget_session_cookies()
+        return False
+    cookies = load_json_file(__cookies_file_path, [])
+    if not isinstance(cookies, list):
+        return False
+    cookies = [cookie for cookie in cookies if isinstance(cookie, dict) and is_cookie_alive(cookie)]
+    if not any(cookie.get("name") == SESSION_COOKIE_NAME for cookie in cookies):
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [{key: cookie[key] for key in COOKIE_FIELDS if key in cookie} for cookie in cookies]})
+    except Exception:
+        # Without DevTools, cookies can only be added while on the LinkedIn domain
+        try:
+            driver.get("https://www.linkedin.com/robots.txt")
+            for cookie in cookies:
+                cookie = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly") if key in cookie}
+                driver.add_cookie(cookie)
+        except Exception as e:
+            critical_error_log("Failed to restore LinkedIn cookies", e)
+            return False
+    print_lg("Restored LinkedIn login from the previous run.")
+    return True
@@ -0,0 +1,82 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import os
+
+
+BLOCK_SIZE = 8192
+# A single poll never sends more than this, if more was written since the last poll only its last lines are sent
+MAX_READ_BYTES = 1024 * 1024
+
+
+def __decode_lines(data: bytes) -> list[str]:
+    return [line.rstrip("\r") for line in data.decode("utf-8", errors="replace").split("\n")]
+
+
+def tail_lines(path: str, max_lines: int = 100, end: int | None = None) -> tuple[list[str], int]:
+    '''
+    Function to get the last `max_lines` complete lines of `path` (up to byte `end`), reading backwards from the end in blocks instead of the whole file.
+    * Returns `(lines, offset)`, `offset` is where the next `read_since()` should start (just after the last complete line)
+    '''
+    try:
+        with open(path, "rb") as file:
+            size = file.seek(0, os.SEEK_END) if end is None else end
+            # Only complete lines, a line still being written is sent by the next poll
+            position = size
+            data = b""
+            while position > 0:
+                read_size = min(BLOCK_SIZE, position)
+                position -= read_size
+                file.seek(position)
+                data = file.read(read_size) + data
+                if data.count(b"\n") > max_lines:
+                    break
+    except FileNotFoundError:
+        return [], 0
+    complete = data.rfind(b"\n") + 1
+    offset = size - (len(data) - complete)
+    lines = __decode_lines(data[:complete - 1]) if complete else []
+    # First line may be cut by the block boundary
+    if position > 0 and lines:
+        lines = lines[1:]
+    return lines[-max_lines:], offset
+
+
+def read_since(path: str, offset: int, max_lines: int = 100) -> tuple[list[str], int, bool]:
+    '''
+    Function to get only the complete lines written to `path` after byte `offset`.
+    * If the file is now smaller than `offset` (Eg: the bot restarted and recreated it), the last `max_lines` are returned instead with `reset = True`
+    * A negative `offset` (Eg: a bad `since` from a client) is read as the start of the file
+    * Returns `(lines, new offset, reset)`
+    '''
+    offset = max(0, offset)
+    try:
+        size = os.path.getsize(path)
+    except FileNotFoundError:
+        return [], 0, offset > 0
+    if offset > size:
+        lines, new_offset = tail_lines(path, max_lines)
+        return lines, new_offset, True
+    if size - offset > MAX_READ_BYTES:
+        lines, new_offset = tail_lines(path, max_lines, size)
+        return lines, new_offset, True
+    with open(path, "rb") as file:
+        file.seek(offset)
+        data = file.read(size - offset)
+    complete = data.rfind(b"\n") + 1
+    if not complete:
+        return [], offset, False
+    return __decode_lines(data[:complete - 1]), offset + complete, False
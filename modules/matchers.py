@@ -0,0 +1,125 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import re
+
+
+def compile_word_matcher(words: list[str]) -> tuple[re.Pattern, dict[str, str]] | None:
+    '''
+    Compiles `words` once into a single case-insensitive alternation regex, so a text can be checked against all of them in one pass.
+    * Words only match as whole words, Eg: "intern" doesn't match "international", but "C++" still matches "C++ developer"
+    * Longer words are tried first, so "senior manager" wins over "manager"
+    * Returns `(pattern, {lower_word: word})` or `None` if there are no words
+    '''
+    originals: dict[str, str] = {}
+    for word in words:
+        word = (word or "").strip()
+        if word and word.lower() not in originals:
+            originals[word.lower()] = word
+    if not originals:
+        return None
+    alternatives = []
+    for lower_word in sorted(originals, key=len, reverse=True):
+        alternative = re.escape(lower_word)
+        if re.match(r"\w", lower_word):
+            alternative = r"(?<!\w)" + alternative
+        if re.search(r"\w$", lower_word):
+            alternative += r"(?!\w)"
+        alternatives.append(alternative)
+    return re.compile("|".join(alternatives), re.IGNORECASE), originals
+
+
+def find_words(matcher: tuple[re.Pattern, dict[str, str]] | None, text: str, first_only: bool = False) -> list[str]:
+    '''
+    Finds the words of a `matcher` from `compile_word_matcher()` that are present in `text`.
+    * Returns the matched words as written in the config, in order of appearance without duplicates
+    * Stops at the first hit if `first_only = True`
+    '''
+    if not matcher or not text:
+        return []
+    pattern, originals = matcher
+    found: list[str] = []
+    for match in pattern.finditer(text):
+        word = originals.get(match.group(0).lower(), match.group(0))
+        if word not in found:
+            found.append(word)
+            if first_only:
+                break
+    return found
+
+
+def __option_features(text: str) -> tuple[str, frozenset[str], frozenset[str]]:
+    '''
+    Returns `(normalized text, word tokens, character trigrams)` used to score options.
+    '''
+    normalized = " ".join(re.sub(r"[^\w]+", " ", (text or "").lower()).split())
+    padded = f"  {normalized} "
+    trigrams = frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+    return normalized, frozenset(normalized.split()), trigrams
+
+
+def __similarity(phrase: tuple, option: tuple) -> float:
+    '''
+    Scores how well a `phrase` describes an `option` (both from `__option_features()`) between 0 and 1.
+    '''
+    phrase_text, phrase_tokens, phrase_trigrams = phrase
+    option_text, option_tokens, option_trigrams = option
+    if not phrase_text or not option_text:
+        return 0.0
+    if phrase_text == option_text:
+        return 1.0
+    # All words of one are in the other. Eg: "Yes" and "Yes, I am authorized"
+    if phrase_tokens <= option_tokens or option_tokens <= phrase_tokens:
+        return 0.9
+    token_score = 2 * len(phrase_tokens & option_tokens) / (len(phrase_tokens) + len(option_tokens))
+    trigram_score = 2 * len(phrase_trigrams & option_trigrams) / (len(phrase_trigrams) + len(option_trigrams))
+    score = max(token_score, trigram_score)
+    # Partial words only. Eg: "no" in "unknown", weighted by how much of the longer text it covers
+    if phrase_text in option_text or option_text in phrase_text:
+        shorter, longer = sorted((len(phrase_text), len(option_text)))
+        score = max(score, 0.4 + 0.4 * shorter / longer)
+    return score
+
+
+def best_option_match(phrases: list[str], options: list[str], ignored: set[int] | None = None) -> tuple[int, float]:
+    '''
+    Finds the option that best matches any of the `phrases`, for select and radio questions.
+    * Options are scored all at once with word-set and character trigram similarity, instead of trying every phrase against every option
+    * Earlier `phrases` are preferred over later ones when scores are close
+    * Options at `ignored` indexes (Eg: placeholder "Select an option") are never returned
+    * Returns `(index, confidence)`, confidence is between 0 and 1. Returns `(-1, 0.0)` if there are no options to choose from
+    '''
+    ignored = ignored or set()
+    candidates = [(index, __option_features(option)) for index, option in enumerate(options) if index not in ignored]
+    if not candidates:
+        return -1, 0.0
+    best_index, best_score = candidates[0][0], 0.0
+    for position, phrase in enumerate(phrases):
+        phrase_features = __option_features(phrase)
+        preference = 1 - 0.02 * position
+        for index, option_features in candidates:
+            score = __similarity(phrase_features, option_features) * preference
+            if score > best_score:
+                best_index, best_score = index, score
+    return best_index, round(best_score, 3)
+
+
+def is_placeholder_option(text: str) -> bool:
+    '''
+    Checks if a select option `text` is the placeholder, Eg: "Select an option".
+    '''
+    normalized = (text or "").strip().lower()
+    return not normalized or normalized.startswith(("select an option", "selecciona una opci", "seleccione una opci"))
@@ -15,25 +15,96 @@ version:    26.01.20.5.08
 '''
 
 import os
+import sys
+import shutil
+import socket
 import tempfile
 
 from modules.helpers import get_default_temp_profile, make_directories
-from config.settings import run_in_background, stealth_mode, disable_extensions, safe_mode, file_name, failed_file_name, logs_folder_path, generated_resume_path
+from config.settings import run_in_background, stealth_mode, disable_extensions, safe_mode, file_name, failed_file_name, logs_folder_path, generated_resume_path, cache_folder_path, reuse_browser_session, remote_debugging_port
 from config.questions import default_resume_path
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 if stealth_mode:
     import undetected_chromedriver as uc
-# from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from modules.helpers import find_default_profile_directory, critical_error_log, print_lg
 from selenium.common.exceptions import SessionNotCreatedException
 
+stealth_driver_path = os.path.join(cache_folder_path, "chromedriver.exe" if sys.platform.startswith('win') else "chromedriver")
+
+
+def get_stealth_driver_path() -> str | None:
+    '''
+    Function to get the patched undetected Chrome Driver, downloading and caching it in `cache_folder_path` only if it's not cached yet.
+    * Returns the path of the cached driver or `None` if it couldn't be downloaded
+    '''
+    if os.path.exists(stealth_driver_path):
+        return stealth_driver_path
+    try:
+        print_lg("Downloading Chrome Driver... This may take some time. It will be cached for the next runs!")
+        from undetected_chromedriver.patcher import Patcher
+        patcher = Patcher()
+        patcher.auto()
+        make_directories([cache_folder_path])
+        # Patcher deletes its own copy on exit, keep ours
+        shutil.copy2(patcher.executable_path, stealth_driver_path)
+        return stealth_driver_path
+    except Exception as e:
+        critical_error_log("Failed to cache undetected Chrome Driver", e)
+        return None
+
+
+def forget_stealth_driver() -> None:
+    '''
+    Function to delete the cached undetected Chrome Driver, Eg: when Chrome updated and the driver doesn't match anymore.
+    '''
+    try:
+        os.remove(stealth_driver_path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print_lg("Failed to delete cached Chrome Driver!", e)
+
+
+def is_debugger_listening(port: int) -> bool:
+    '''
+    Function to check if a Chrome from an earlier run is still listening on remote debugging `port`.
+    '''
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def attachChromeSession(port: int = remote_debugging_port):
+    '''
+    Function to reconnect to the Chrome kept open by an earlier run with `reuse_browser_session = True`.
+    * Returns `(options, driver, actions, wait)`, all `None` if there is no Chrome to reconnect to
+    '''
+    if not is_debugger_listening(port):
+        return None, None, None, None
+    options = Options()
+    options.debugger_address = f"127.0.0.1:{port}"
+    try:
+        driver_path = get_stealth_driver_path() if stealth_mode else None
+        driver = webdriver.Chrome(options=options, service=Service(executable_path=driver_path)) if driver_path else webdriver.Chrome(options=options)
+    except Exception as e:
+        critical_error_log(f"Failed to reconnect to Chrome on port {port}, opening a new one", e)
+        return None, None, None, None
+    print_lg(f"Reconnected to the Chrome kept open on port {port}.")
+    return options, driver, ActionChains(driver), WebDriverWait(driver, 10)
+
+
 def createChromeSession(isRetry: bool = False, use_stealth: bool = stealth_mode, use_profile: bool = True):
     make_directories([file_name,failed_file_name,logs_folder_path+"/screenshots",default_resume_path,generated_resume_path+"/temp"])
+    # Chrome that outlives the bot can't be launched by undetected-chromedriver, launch it with the patched driver instead
+    use_uc = use_stealth and not reuse_browser_session
     # Set up WebDriver with Chrome Profile
-    options = uc.ChromeOptions() if use_stealth else Options()
+    options = uc.ChromeOptions() if use_uc else Options()
     if run_in_background:   options.add_argument("--headless=new")
     if disable_extensions:  options.add_argument("--disable-extensions")
     options.add_argument("--disable-gpu")
@@ -42,6 +113,9 @@ def createChromeSession(isRetry: bool = False, use_stealth: bool = stealth_mode,
     options.add_argument("--no-default-browser-check")
     options.add_argument("--disable-notifications")
     options.add_argument("--window-size=1920,1080")
+    if reuse_browser_session:
+        options.add_argument(f"--remote-debugging-port={remote_debugging_port}")
+        options.add_experimental_option("detach", True)
 
     print_lg("IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM! Or it's highly likely that application will just open browser and not do anything!")
     profile_dir = find_default_profile_directory()
@@ -55,56 +129,74 @@ def createChromeSession(isRetry: bool = False, use_stealth: bool = stealth_mode,
         options.add_argument(f"--user-data-dir={unique_profile}")
     elif profile_dir and not safe_mode:
         options.add_argument(f"--user-data-dir={profile_dir}")
+    elif reuse_browser_session:
+        # Same profile every run, so the kept open Chrome stays logged in even after it's closed
+        reusable_profile = os.path.join(get_default_temp_profile(), "reusable-session")
+        make_directories([reusable_profile])
+        options.add_argument(f"--user-data-dir={reusable_profile}")
     else:
         print_lg("Logging in with a guest profile, Web history will not be saved!")
         temp_root = get_default_temp_profile()
         make_directories([temp_root])
         unique_profile = tempfile.mkdtemp(prefix="auto-job-profile-", dir=temp_root)
         options.add_argument(f"--user-data-dir={unique_profile}")
-    if use_stealth:
-        # try: 
-        #     driver = uc.Chrome(driver_executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe", options=options)
-        # except (FileNotFoundError, PermissionError) as e: 
-        #     print_lg("(Undetected Mode) Got '{}' when using pre-installed ChromeDriver.".format(type(e).__name__)) 
-            print_lg("Downloading Chrome Driver... This may take some time. Undetected mode requires download every run!")
-            driver = uc.Chrome(options=options)
+    driver_path = get_stealth_driver_path() if use_stealth else None
+    if use_uc:
+        if driver_path: driver = uc.Chrome(options=options, driver_executable_path=driver_path)
+        else:           driver = uc.Chrome(options=options)
+    elif driver_path:   driver = webdriver.Chrome(options=options, service=Service(executable_path=driver_path))
     else: driver = webdriver.Chrome(options=options) #, service=Service(executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe"))
     driver.maximize_window()
     wait = WebDriverWait(driver, 10)
     actions = ActionChains(driver)
     return options, driver, actions, wait
 
-try:
-    options, driver, actions, wait = None, None, None, None
-    options, driver, actions, wait = createChromeSession(use_stealth=stealth_mode)
-except SessionNotCreatedException as e:
-    critical_error_log("Failed to create Chrome Session, retrying with guest profile", e)
+
+# Set by open_browser()
+options, driver, actions, wait = None, None, None, None
+
+
+def open_browser():
+    '''
+    Function to open Chrome (or reconnect to the one kept open with `reuse_browser_session = True`), retrying with a guest profile and without stealth mode if it fails.
+    * Sets and returns the module's `(options, driver, actions, wait)`
+    '''
+    global options, driver, actions, wait
     try:
-        options, driver, actions, wait = createChromeSession(True, use_stealth=stealth_mode)
-    except SessionNotCreatedException as e2:
-        critical_error_log("Retry with guest profile failed. Retrying with clean no-profile session.", e2)
-        options, driver, actions, wait = createChromeSession(True, use_stealth=False, use_profile=False)
-except Exception as e:
-    if stealth_mode:
+        if reuse_browser_session:
+            options, driver, actions, wait = attachChromeSession()
+        if driver is None:
+            options, driver, actions, wait = createChromeSession(use_stealth=stealth_mode)
+    except SessionNotCreatedException as e:
+        critical_error_log("Failed to create Chrome Session, retrying with guest profile", e)
+        # Cached driver might be for an older Chrome version
+        if stealth_mode: forget_stealth_driver()
         try:
-            print_lg("Undetected Chrome failed. Retrying with standard Selenium ChromeDriver...")
-            options, driver, actions, wait = createChromeSession(True, use_stealth=False)
-        except Exception as e2:
+            options, driver, actions, wait = createChromeSession(True, use_stealth=stealth_mode)
+        except SessionNotCreatedException as e2:
+            critical_error_log("Retry with guest profile failed. Retrying with clean no-profile session.", e2)
+            options, driver, actions, wait = createChromeSession(True, use_stealth=False, use_profile=False)
+    except Exception as e:
+        if stealth_mode:
+            try:
+                print_lg("Undetected Chrome failed. Retrying with standard Selenium ChromeDriver...")
+                options, driver, actions, wait = createChromeSession(True, use_stealth=False)
+            except Exception as e2:
+                msg = 'Seems like Google Chrome is out dated. Update browser and try again! \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/GodsScion/Auto_job_applier_linkedIn \n                                   OR \nReach out in discord ( https://discord.gg/fFp7uUzWCY )'
+                if isinstance(e2,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
+                print_lg(msg)
+                critical_error_log("In Opening Chrome", e2)
+                from pyautogui import alert
+                alert(msg, "Error in opening chrome")
+                try: driver.quit()
+                except (NameError, AttributeError): exit()
+        else:
             msg = 'Seems like Google Chrome is out dated. Update browser and try again! \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/GodsScion/Auto_job_applier_linkedIn \n                                   OR \nReach out in discord ( https://discord.gg/fFp7uUzWCY )'
-            if isinstance(e2,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
+            if isinstance(e,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
             print_lg(msg)
-            critical_error_log("In Opening Chrome", e2)
+            critical_error_log("In Opening Chrome", e)
             from pyautogui import alert
             alert(msg, "Error in opening chrome")
             try: driver.quit()
-            except NameError: exit()
-    else:
-        msg = 'Seems like Google Chrome is out dated. Update browser and try again! \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/GodsScion/Auto_job_applier_linkedIn \n                                   OR \nReach out in discord ( https://discord.gg/fFp7uUzWCY )'
-        if isinstance(e,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
-        print_lg(msg)
-        critical_error_log("In Opening Chrome", e)
-        from pyautogui import alert
-        alert(msg, "Error in opening chrome")
-        try: driver.quit()
-        except NameError: exit()
-    
+            except (NameError, AttributeError): exit()
+    return options, driver, actions, wait
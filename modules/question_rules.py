@@ -0,0 +1,93 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import re
+
+
+'''
+A question rule is a dict with the following keys:
+* `all`: list of keyword groups, the label must contain at least one keyword of EVERY group. Eg: `[("salary", "ctc"), ("current",)]`
+* `none`: (Optional) keywords that must NOT be in the label. Eg: `("last",)`
+* `answer`: the answer `str`, or a callable taking the context (Eg: `work_location`) as keyword arguments and returning the answer
+* `type`: (Optional) "text" (default) or "number", numbers are reduced to their numeric part. Eg: "30 days" -> "30"
+* `priority`: (Optional) lower is checked first, defaults to the position in the table
+* `do_actions`: (Optional) `True` if the field is an auto-complete that needs ARROW_DOWN + ENTER after typing
+
+Keywords are matched as plain substrings of the lower cased label, same as `"keyword" in label`.
+'''
+
+
+def compile_question_rules(rules: list[dict]) -> dict:
+    '''
+    Compiles a table of question `rules` into a single matcher.
+    * All keywords of all rules go in ONE regex, so a label is scanned once no matter how many rules there are
+    * Returns a dict to be passed to `match_question_rule()`
+    '''
+    compiled_rules = []
+    keywords: set[str] = set()
+    for position, rule in enumerate(rules):
+        groups = [frozenset(keyword.lower() for keyword in group) for group in rule["all"]]
+        excluded = frozenset(keyword.lower() for keyword in rule.get("none", ()))
+        keywords.update(*groups, excluded)
+        compiled_rules.append({**rule, "all": groups, "none": excluded, "priority": rule.get("priority", position)})
+    compiled_rules.sort(key=lambda rule: rule["priority"])
+
+    # Lookahead finds a keyword at every position, longest first. Shorter keywords inside a found one are implied.
+    ordered_keywords = sorted(keywords, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in ordered_keywords) + "))") if keywords else None
+    implied = {keyword: frozenset(other for other in keywords if other in keyword) for keyword in keywords}
+    return {"pattern": pattern, "implied": implied, "rules": compiled_rules}
+
+
+def find_rule_keywords(compiled: dict, label: str) -> set[str]:
+    '''
+    Returns all keywords of the `compiled` rules present in the lower cased `label`.
+    '''
+    hits: set[str] = set()
+    if compiled["pattern"] and label:
+        for match in compiled["pattern"].finditer(label):
+            hits |= compiled["implied"][match.group(1)]
+    return hits
+
+
+def match_question_rule(compiled: dict, label: str) -> dict | None:
+    '''
+    Finds the first rule (by priority) of `compiled` rules matching the lower cased `label`.
+    * Returns the rule or `None` if no rule matches
+    '''
+    hits = find_rule_keywords(compiled, label)
+    if not hits:
+        return None
+    for rule in compiled["rules"]:
+        if all(group & hits for group in rule["all"]) and not (rule["none"] & hits):
+            return rule
+    return None
+
+
+def resolve_rule_answer(rule: dict, **context) -> str:
+    '''
+    Returns the answer of a matched `rule` as a string, coerced to its `type`.
+    * `context` is passed to callable answers. Eg: `work_location="Chicago"`
+    '''
+    answer = rule["answer"]
+    if callable(answer):
+        answer = answer(**context)
+    answer = "" if answer is None else str(answer)
+    if rule.get("type") == "number":
+        number = re.search(r"\d+(?:\.\d+)?", answer.replace(",", ""))
+        if number:
+            answer = number.group(0)
+    return answer
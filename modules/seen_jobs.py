@@ -0,0 +1,106 @@
+'''
+Author:     Sai Vignesh Golla
+LinkedIn:   https://www.linkedin.com/in/saivigneshgolla/
+
+Copyright (C) 2024 Sai Vignesh Golla
+
+License:    GNU Affero General Public License
+            https://www.gnu.org/licenses/agpl-3.0.en.html
+
+GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
+
+Support me: https://github.com/sponsors/GodsScion
+
+version:    26.01.20.5.08
+'''
+
+import json
+
+from time import time
+from hashlib import sha1
+
+from config.settings import cache_folder_path, seen_jobs_ttl_days
+from modules.helpers import load_json_file, save_json_file, print_lg
+
+
+__seen_jobs_file_path = (cache_folder_path + "/seen_jobs.json").replace("//", "/")
+__seen_index: dict | None = None
+
+
+def __get_seen_index() -> dict:
+    '''
+    Function to load the seen jobs index from disk once, dropping expired entries.
+    * Stored as `{"fingerprint": str, "jobs": {job_id: {"verdict": str, "reason": str, "seen_at": float}}}`
+    '''
+    global __seen_index
+    if __seen_index is None:
+        stored = load_json_file(__seen_jobs_file_path, {})
+        # Files of older versions have no fingerprint, their verdicts are dropped by the first `use_rejection_settings()`
+        if not isinstance(stored, dict) or not isinstance(stored.get("jobs"), dict):
+            stored = {"fingerprint": "", "jobs": {}}
+        __seen_index = stored
+        seen_jobs = __seen_index["jobs"]
+        expired = [job_id for job_id, entry in seen_jobs.items() if is_expired(entry)]
+        for job_id in expired:
+            del seen_jobs[job_id]
+        if expired:
+            save_json_file(__seen_jobs_file_path, __seen_index)
+        print_lg(f"Loaded {len(seen_jobs)} seen jobs from {__seen_jobs_file_path} ({len(expired)} expired).")
+    return __seen_index
+
+
+def __get_seen_jobs() -> dict[str, dict]:
+    return __get_seen_index()["jobs"]
+
+
+def use_rejection_settings(settings: dict) -> None:
+    '''
+    Function to bind the index to the current values of the `settings` that decide if a job is rejected (Eg: `bad_words`, `current_experience`).
+    * Verdicts given with different settings are forgotten, since they may no longer hold
+    '''
+    fingerprint = sha1(json.dumps(settings, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    seen_index = __get_seen_index()
+    if seen_index.get("fingerprint") == fingerprint:
+        return
+    if seen_index["jobs"]:
+        print_lg(f"Settings that reject jobs changed, forgetting {len(seen_index['jobs'])} seen jobs.")
+    seen_index["fingerprint"] = fingerprint
+    seen_index["jobs"] = {}
+    save_json_file(__seen_jobs_file_path, seen_index)
+
+
+def is_expired(entry: dict) -> bool:
+    '''
+    Function to check if a seen job `entry` is older than `seen_jobs_ttl_days`.
+    '''
+    try:
+        return time() - float(entry.get("seen_at", 0)) > seen_jobs_ttl_days * 86400
+    except (TypeError, ValueError, AttributeError):
+        return True
+
+
+def get_seen_job(job_id: str) -> dict | None:
+    '''
+    Function to get the stored verdict of `job_id`.
+    * Returns `{"verdict": str, "reason": str, "seen_at": float}` or `None` if unknown, expired or the index is disabled
+    '''
+    if seen_jobs_ttl_days <= 0 or not job_id or job_id == "Unknown":
+        return None
+    seen_jobs = __get_seen_jobs()
+    entry = seen_jobs.get(job_id)
+    if entry is None:
+        return None
+    if is_expired(entry):
+        del seen_jobs[job_id]
+        return None
+    return entry
+
+
+def record_seen_job(job_id: str, verdict: str, reason: str | None) -> None:
+    '''
+    Function to remember the `verdict` (Eg: "rejected") and `reason` for `job_id` across runs.
+    '''
+    if seen_jobs_ttl_days <= 0 or not job_id or job_id == "Unknown":
+        return
+    __get_seen_jobs()[job_id] = {"verdict": verdict, "reason": reason or "Unknown", "seen_at": time()}
+    save_json_file(__seen_jobs_file_path, __get_seen_index())
@@ -21,7 +21,7 @@ __validation_file_path = ""
 
 
 def check_int(
-    var: int, var_name: str, min_value: int = 0
+    var: int, var_name: str, min_value: int = 0, max_value: int | None = None
 ) -> bool | TypeError | ValueError:
     if not isinstance(var, int):
         raise TypeError(
@@ -31,6 +31,10 @@ def check_int(
         raise ValueError(
             f'The variable "{var_name}" in "{__validation_file_path}" expects an Integer greater than or equal to `{min_value}`! Received `{var}` instead!\n\nSolution:\nPlease open "{__validation_file_path}" and update "{var_name}" accordingly.'
         )
+    if max_value is not None and var > max_value:
+        raise ValueError(
+            f'The variable "{var_name}" in "{__validation_file_path}" expects an Integer less than or equal to `{max_value}`! Received `{var}` instead!\n\nSolution:\nPlease open "{__validation_file_path}" and update "{var_name}" accordingly.'
+        )
     return True
 
 
@@ -313,6 +317,17 @@ def validate_settings() -> None | ValueError | TypeError:
     check_string(file_name, "file_name", min_length=1)
     check_string(failed_file_name, "failed_file_name", min_length=1)
     check_string(logs_folder_path, "logs_folder_path", min_length=1)
+    check_string(cache_folder_path, "cache_folder_path", min_length=1)
+    check_int(seen_jobs_ttl_days, "seen_jobs_ttl_days", 0)
+    check_int(company_verdict_ttl_days, "company_verdict_ttl_days", 0)
+    check_boolean(resume_from_checkpoint, "resume_from_checkpoint")
+    check_boolean(remember_login, "remember_login")
+    check_string(login_cookies_file_path, "login_cookies_file_path", min_length=1)
+    check_string(screenshot_format, "screenshot_format", ["png", "jpeg", "webp"])
+    check_int(screenshot_quality, "screenshot_quality", 1, 100)
+    check_int(max_screenshots_per_run, "max_screenshots_per_run", 0)
+    check_int(max_page_snapshot_kb, "max_page_snapshot_kb", 0)
+    check_boolean(page_snapshot_subtrees_only, "page_snapshot_subtrees_only")
 
     check_int(click_gap, "click_gap", 0)
 
@@ -322,6 +337,9 @@ def validate_settings() -> None | ValueError | TypeError:
     check_boolean(smooth_scroll, "smooth_scroll")
     check_boolean(keep_screen_awake, "keep_screen_awake")
     check_boolean(stealth_mode, "stealth_mode")
+    check_int(ai_model_validation_ttl_days, "ai_model_validation_ttl_days", 0)
+    check_boolean(reuse_browser_session, "reuse_browser_session")
+    check_int(remote_debugging_port, "remote_debugging_port", 1024)
 
 
 def validate_config() -> bool | ValueError | TypeError:
@@ -15,10 +15,14 @@ version:    26.01.20.5.08
 """
 
 # Imports
+import time
+
+# Run `python -X importtime runAiBot.py` to see which imports slow down start-up
+import_started_at = time.perf_counter()
+
 import os
 import csv
 import re
-import time
 import sys
 import unicodedata
 import pyautogui
@@ -27,7 +31,8 @@ from urllib.parse import quote_plus, urlencode, urlparse, parse_qsl, urlunparse
 # Set CSV field size limit to prevent field size errors
 csv.field_size_limit(1000000)  # Set to 1MB instead of default 131KB
 
-from random import choice, shuffle, randint
+from random import choice, shuffle
+from functools import lru_cache
 from datetime import datetime
 
 from selenium.webdriver.common.by import By
@@ -55,20 +60,50 @@ from modules.open_chrome import *
 from modules.helpers import *
 from modules.clickers_and_finders import *
 from modules.validator import validate_config
+from modules.matchers import (
+    compile_word_matcher,
+    find_words,
+    best_option_match,
+    is_placeholder_option,
+)
+from modules.question_rules import (
+    compile_question_rules,
+    match_question_rule,
+    resolve_rule_answer,
+)
+from modules.debug_capture import take_screenshot, save_page_snapshot
+from modules.seen_jobs import get_seen_job, record_seen_job, use_rejection_settings
+from modules.checkpoint import load_checkpoint, save_checkpoint, clear_checkpoint
+from modules.bot_status import start_status, publish_status, record_job_outcome
+from modules.config_watcher import watch_configs, reload_changed_configs
+from modules.linkedin_session import (
+    has_session_cookie,
+    save_session_cookies,
+    restore_session_cookies,
+    forget_session_cookies,
+)
+from modules.company_verdicts import (
+    get_company_verdict,
+    record_company_verdict,
+    use_company_word_lists,
+)
 
-# Import AI modules
-if use_AI:
+# Import AI modules, only the SDK of the selected `ai_provider` is loaded
+if use_AI and ai_provider.lower() in ("openai", "deepseek"):
+    # DeepSeek clients are closed with the OpenAI SDK
     from modules.ai.openaiConnections import (
         ai_create_openai_client,
         ai_extract_skills,
         ai_answer_question,
         ai_close_openai_client,
     )
+if use_AI and ai_provider.lower() == "deepseek":
     from modules.ai.deepseekConnections import (
         deepseek_create_client,
         deepseek_extract_skills,
         deepseek_answer_question,
     )
+if use_AI and ai_provider.lower() == "gemini":
     from modules.ai.geminiConnections import (
         gemini_create_client,
         gemini_extract_skills,
@@ -85,6 +120,8 @@ if use_AI:
 
 from typing import Literal
 
+import_time = time.perf_counter() - import_started_at
+
 
 pyautogui.FAILSAFE = False
 try:
@@ -119,28 +156,164 @@ external_jobs_count = 0
 failed_count = 0
 skip_count = 0
 dailyEasyApplyLimitReached = False
+resume_checkpoint = None
 
 re_experience = re.compile(
     r"[(]?\s*(\d+)\s*[)]?\s*[-to]*\s*\d*[+]*\s*year[s]?", re.IGNORECASE
 )
 
-desired_salary_lakhs = str(round(desired_salary / 100000, 2))
-desired_salary_monthly = str(round(desired_salary / 12, 2))
-desired_salary = str(desired_salary)
 
-current_ctc_lakhs = str(round(current_ctc / 100000, 2))
-current_ctc_monthly = str(round(current_ctc / 12, 2))
-current_ctc = str(current_ctc)
+def derive_question_values() -> None:
+    """
+    Function to derive the answers to salary and notice period questions from `config/questions.py`.
+    * Expects the numbers as they are in the config file, they are replaced by strings
+    """
+    global desired_salary, desired_salary_lakhs, desired_salary_monthly, \
+        current_ctc, current_ctc_lakhs, current_ctc_monthly, \
+        notice_period, notice_period_months, notice_period_weeks
+    desired_salary_lakhs = str(round(desired_salary / 100000, 2))
+    desired_salary_monthly = str(round(desired_salary / 12, 2))
+    desired_salary = str(desired_salary)
+
+    current_ctc_lakhs = str(round(current_ctc / 100000, 2))
+    current_ctc_monthly = str(round(current_ctc / 12, 2))
+    current_ctc = str(current_ctc)
+
+    notice_period_months = str(notice_period // 30)
+    notice_period_weeks = str(notice_period // 7)
+    notice_period = str(notice_period)
+
+
+def compile_search_matchers() -> None:
+    """
+    Function to compile the word lists of `config/search.py`, so each job description is scanned in a single pass.
+    """
+    global bad_words_matcher, about_company_good_words_matcher, about_company_bad_words_matcher
+    bad_words_matcher = compile_word_matcher(bad_words)
+    about_company_good_words_matcher = compile_word_matcher(about_company_good_words)
+    about_company_bad_words_matcher = compile_word_matcher(about_company_bad_words)
+
+
+# Settings of `config/search.py` whose values decide the verdicts remembered in the seen jobs index
+REJECTION_SETTINGS = (
+    "bad_words",
+    "about_company_good_words",
+    "about_company_bad_words",
+    "current_experience",
+    "did_masters",
+    "security_clearance",
+    "english_only_jobs",
+)
+
+
+def use_seen_job_settings() -> None:
+    """
+    Function to bind the seen jobs index to the current `REJECTION_SETTINGS`, verdicts given with other values are forgotten.
+    """
+    module_globals = globals()
+    use_rejection_settings({name: module_globals[name] for name in REJECTION_SETTINGS})
+
+
+derive_question_values()
+compile_search_matchers()
+
+
+def build_text_question_rules() -> list[dict]:
+    """
+    Rule table for text field questions, checked in order (see `modules/question_rules.py` for the format).
+    * Answers are precomputed from `config/personals.py` and `config/questions.py`
+    """
+    salary_words = ("salary", "compensation", "ctc", "pay")
+    current_words = ("current", "present")
+    return [
+        {"all": [("experience", "years")], "answer": years_of_experience, "type": "number"},
+        {"all": [("phone", "mobile")], "answer": phone_number},
+        {"all": [("street",)], "answer": street},
+        {
+            "all": [("city", "location", "address")],
+            "answer": lambda work_location="", **_: current_city or work_location,
+            "do_actions": True,
+        },
+        # What if question is 'name of the city or university you attend, name of referral etc?'
+        {"all": [("signature",)], "answer": full_name},
+        {"all": [("name",), ("full",)], "answer": full_name},
+        {"all": [("name",), ("first",)], "none": ("last",), "answer": first_name},
+        {"all": [("name",), ("middle",)], "none": ("last",), "answer": middle_name},
+        {"all": [("name",), ("last",)], "none": ("first",), "answer": last_name},
+        {"all": [("name",), ("employer",)], "answer": recent_employer},
+        {"all": [("name",)], "answer": full_name},
+        {"all": [("notice",), ("month",)], "answer": notice_period_months, "type": "number"},
+        {"all": [("notice",), ("week",)], "answer": notice_period_weeks, "type": "number"},
+        {"all": [("notice",)], "answer": notice_period, "type": "number"},
+        {"all": [salary_words, current_words, ("month",)], "answer": current_ctc_monthly, "type": "number"},
+        {"all": [salary_words, current_words, ("lakh",)], "answer": current_ctc_lakhs, "type": "number"},
+        {"all": [salary_words, current_words], "answer": current_ctc, "type": "number"},
+        {"all": [salary_words, ("month",)], "answer": desired_salary_monthly, "type": "number"},
+        {"all": [salary_words, ("lakh",)], "answer": desired_salary_lakhs, "type": "number"},
+        {"all": [salary_words], "answer": desired_salary, "type": "number"},
+        {"all": [("linkedin",)], "answer": linkedIn},
+        {"all": [("website", "blog", "portfolio", "link")], "answer": website},
+        {"all": [("scale of 1-10",)], "answer": confidence_level},
+        {"all": [("headline",)], "answer": linkedin_headline},
+        {
+            "all": [("hear", "come across"), ("this",), ("job", "position")],
+            "answer": "https://github.com/GodsScion/Auto_job_applier_linkedIn",
+        },
+        {"all": [("state", "province")], "answer": state},
+        {"all": [("zip", "postal", "code")], "answer": zipcode},
+        {"all": [("country",)], "answer": country},
+        # Same as `answer_common_questions()`
+        {"all": [("sponsorship", "visa")], "answer": require_visa},
+    ]
+
+
+text_question_rules = compile_question_rules(build_text_question_rules())
+
+# New `search_terms` saved while the bot runs, used from the next search term on
+pending_search_terms = None
 
-notice_period_months = str(notice_period // 30)
-notice_period_weeks = str(notice_period // 7)
-notice_period = str(notice_period)
+
+def apply_config_changes() -> None:
+    """
+    Function to pick up changes to `config/questions.py` and `config/search.py` made while the bot runs (Eg: from the dashboard).
+    * Only variables whose value changed in the file are updated, so choices made while running (Eg: "Disable Pause") are kept
+    * Derived answers, question rules and word matchers are rebuilt, new `search_terms` wait for the next search term
+    """
+    global text_question_rules, pending_search_terms
+    changed = reload_changed_configs()
+    if not changed:
+        return
+    module_globals = globals()
+    for name, (old_values, new_values) in changed.items():
+        updates = {key: value for key, value in new_values.items() if key not in old_values or old_values[key] != value}
+        changed_names = ", ".join(sorted(updates)) or "none"
+        if name == "questions":
+            if run_in_background:
+                updates.pop("pause_before_submit", None)
+                updates.pop("pause_at_failed_question", None)
+            # Derived values are rebuilt from the numbers, not from the strings they were turned into
+            for key in ("desired_salary", "current_ctc", "notice_period"):
+                updates.setdefault(key, new_values[key])
+            module_globals.update(updates)
+            derive_question_values()
+            text_question_rules = compile_question_rules(build_text_question_rules())
+        elif name == "search":
+            module_globals.update(updates)
+            compile_search_matchers()
+            use_company_word_lists(about_company_good_words, about_company_bad_words)
+            use_seen_job_settings()
+            if "search_terms" in updates:
+                pending_search_terms = list(updates["search_terms"])
+        print_lg(f"Applied changes of config/{name}.py: {changed_names}")
 
 aiClient = None
 ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
 about_company_for_ai = None  # TODO extract about company for AI
 ##<
 
+# Minimum confidence of `best_option_match()` to trust a select or radio option as the answer
+MIN_OPTION_CONFIDENCE = 0.6
+
 FILTER_LABEL_ALIASES = {
     "Most recent": ["Mas recientes", "Más recientes", "Recientes"],
     "Most relevant": ["Mas relevantes", "Más relevantes", "Relevantes"],
@@ -184,6 +357,7 @@ def filter_candidates(label: str) -> list[str]:
     return out
 
 
+@lru_cache(maxsize=4096)
 def normalize_filter_text(text: str) -> str:
     value = (text or "").strip()
     if not value:
@@ -200,6 +374,20 @@ def normalize_filter_text(text: str) -> str:
     return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
 
 
+@lru_cache(maxsize=256)
+def filter_label_norms(label: str) -> tuple[str, ...]:
+    """
+    Normalized, non-empty candidates of a filter `label` and its aliases.
+    * Memoized, the alias table is pre-normalized at import below
+    """
+    norms = (normalize_filter_text(item) for item in filter_candidates(label))
+    return tuple(item for item in norms if item)
+
+
+for _filter_label in FILTER_LABEL_ALIASES:
+    filter_label_norms(_filter_label)
+
+
 def resolve_click_target(element: WebElement) -> WebElement:
     if element.tag_name in {"button", "label", "a", "input"}:
         return element
@@ -215,8 +403,7 @@ def resolve_click_target(element: WebElement) -> WebElement:
 def click_filter_text(
     container: WebElement, label: str, click_gap_buffer: bool = True
 ) -> bool:
-    label_norms = [normalize_filter_text(item) for item in filter_candidates(label)]
-    label_norms = [item for item in label_norms if item]
+    label_norms = filter_label_norms(label)
     if not label_norms:
         return False
 
@@ -283,8 +470,7 @@ def multi_sel_flexible(
 def boolean_button_click_flexible(
     container: WebElement, actions: ActionChains, text: str
 ) -> None:
-    label_norms = [normalize_filter_text(item) for item in filter_candidates(text)]
-    label_norms = [item for item in label_norms if item]
+    label_norms = filter_label_norms(text)
     if not label_norms:
         print_lg(f"Click Failed! Didn't find '{text}'")
         return
@@ -417,6 +603,7 @@ def click_easy_apply_quick_filter() -> bool:
 def is_logged_in_LN() -> bool:
     """
     Function to check if user is logged-in in LinkedIn
+    * Decides from the URL and the `li_at` session cookie, page elements are only checked if cookies can't be read
     * Returns: `True` if user is logged-in or `False` if not
     """
     current_url = (driver.current_url or "").lower()
@@ -426,9 +613,14 @@ def is_logged_in_LN() -> bool:
         "/login" in current_url
         or "/checkpoint" in current_url
         or "/signup" in current_url
+        or "/authwall" in current_url
     ):
         return False
 
+    logged_in = has_session_cookie(driver)
+    if logged_in is not None:
+        return logged_in
+
     # Login form fields visible => not logged in
     if try_xp(driver, '//input[@id="username" or @name="session_key"]', False):
         return False
@@ -891,16 +1083,31 @@ def get_job_main_details(
         )
 
     # Skip if previously rejected due to blacklist or already applied
+    company_verdict = get_company_verdict(company)
     if company in blacklisted_companies:
         print_lg(
             f'Skipping "{title} | {company}" job (Blacklisted Company). Job ID: {job_id}!'
         )
         skip = True
+    elif company_verdict and not company_verdict["allowed"]:
+        print_lg(
+            f'Skipping "{title} | {company}" job (Blacklisted Company, About Company contains "{company_verdict["matched_word"]}"). Job ID: {job_id}!'
+        )
+        blacklisted_companies.add(company)
+        skip = True
     elif job_id in rejected_jobs:
         print_lg(
             f'Skipping previously rejected "{title} | {company}" job. Job ID: {job_id}!'
         )
         skip = True
+    else:
+        seen_job = get_seen_job(job_id)
+        if seen_job:
+            print_lg(
+                f'Skipping "{title} | {company}" job, {seen_job["verdict"]} in an earlier run ({seen_job["reason"]}). Job ID: {job_id}!'
+            )
+            rejected_jobs.add(job_id)
+            skip = True
     try:
         if (
             job.find_element(By.CLASS_NAME, "job-card-container__footer-job-state").text
@@ -928,24 +1135,38 @@ def check_blacklist(
             "jobs-details__main-content",
         ],
     )
+    company_verdict = get_company_verdict(company)
+    if company_verdict:
+        # Already checked this company in an earlier job, no need to scroll to and read About Company again
+        if not company_verdict["allowed"]:
+            rejected_jobs.add(job_id)
+            blacklisted_companies.add(company)
+            raise ValueError(
+                f'"{company}" About Company contains "{company_verdict["matched_word"]}" (remembered).'
+            )
+        return rejected_jobs, blacklisted_companies, jobs_top_card
     about_company_org = find_by_class(driver, "jobs-company__box")
     scroll_to_view(driver, about_company_org)
     about_company_org = about_company_org.text
-    about_company = about_company_org.lower()
-    skip_checking = False
-    for word in about_company_good_words:
-        if word.lower() in about_company:
-            print_lg(
-                f'Found the word "{word}". So, skipped checking for blacklist words.'
+    matched_good_word = None
+    good_words_found = find_words(
+        about_company_good_words_matcher, about_company_org, first_only=True
+    )
+    if good_words_found:
+        matched_good_word = good_words_found[0]
+        print_lg(
+            f'Found the word "{matched_good_word}". So, skipped checking for blacklist words.'
+        )
+    else:
+        bad_words_found = find_words(about_company_bad_words_matcher, about_company_org)
+        if bad_words_found:
+            rejected_jobs.add(job_id)
+            blacklisted_companies.add(company)
+            record_company_verdict(company, False, bad_words_found[0])
+            raise ValueError(
+                f'\n"{about_company_org}"\n\nContains "{", ".join(bad_words_found)}".'
             )
-            skip_checking = True
-            break
-    if not skip_checking:
-        for word in about_company_bad_words:
-            if word.lower() in about_company:
-                rejected_jobs.add(job_id)
-                blacklisted_companies.add(company)
-                raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
+    record_company_verdict(company, True, matched_good_word)
     buffer(click_gap)
     scroll_to_view(driver, jobs_top_card)
     return rejected_jobs, blacklisted_companies, jobs_top_card
@@ -985,12 +1206,11 @@ def get_job_description() -> tuple[
         skip = False
         skipReason = None
         skipMessage = None
-        for word in bad_words:
-            if word.lower() in jobDescriptionLow:
-                skipMessage = f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
-                skipReason = "Found a Bad Word in About Job"
-                skip = True
-                break
+        bad_words_found = find_words(bad_words_matcher, jobDescription)
+        if bad_words_found:
+            skipMessage = f'\n{jobDescription}\n\nContains bad word "{", ".join(bad_words_found)}". Skipping this job!\n'
+            skipReason = "Found a Bad Word in About Job"
+            skip = True
         if (
             not skip
             and security_clearance == False
@@ -1143,6 +1363,45 @@ def try_select_phone_country_code(select: Select, desired_code: str) -> str | No
     return None
 
 
+RADIO_OPTIONS_SCRIPT = """
+const fieldset = arguments[0];
+return Array.from(fieldset.querySelectorAll('input')).map((input, key) => {
+    const label = input.id ? fieldset.querySelector(`label[for="${CSS.escape(input.id)}"]`) : null;
+    return {
+        key: key,
+        label: label ? (label.innerText || label.textContent || '').trim() : '',
+        value: input.getAttribute('value'),
+        checked: input.checked,
+    };
+});
+"""
+
+CLICK_RADIO_OPTION_SCRIPT = """
+const fieldset = arguments[0];
+const input = fieldset.querySelectorAll('input')[arguments[1]];
+if (!input) return false;
+const label = input.id ? fieldset.querySelector(`label[for="${CSS.escape(input.id)}"]`) : null;
+(label || input).click();
+return true;
+"""
+
+
+def read_radio_options(radio: WebElement) -> list[dict]:
+    """
+    Function to read all options of a radio `fieldset` in one script call.
+    * Returns a list of `{"key": int, "label": str, "value": str, "checked": bool}`, `key` is passed to `click_radio_option()`
+    """
+    return driver.execute_script(RADIO_OPTIONS_SCRIPT, radio) or []
+
+
+def click_radio_option(radio: WebElement, key: int) -> None:
+    """
+    Function to select the radio option `key` (from `read_radio_options()`) by clicking its label in one script call.
+    """
+    if not driver.execute_script(CLICK_RADIO_OPTION_SCRIPT, radio, key):
+        raise NoSuchElementException(f"Radio option {key} is no longer available!")
+
+
 # Function to answer the questions for Easy Apply
 def answer_questions(
     modal: WebElement,
@@ -1253,28 +1512,27 @@ def answer_questions(
                             "".join(c for c in answer if c.isalnum())
                         )
                     ##<
-                    foundOption = False
-                    for phrase in possible_answer_phrases:
-                        for option in optionsText:
-                            # Check if phrase is in option or option is in phrase (bidirectional matching)
-                            if (
-                                phrase.lower() in option.lower()
-                                or option.lower() in phrase.lower()
-                            ):
-                                select.select_by_visible_text(option)
-                                answer = option
-                                foundOption = True
-                                break
-                    if not foundOption:
+                    option_index, confidence = best_option_match(
+                        possible_answer_phrases,
+                        optionsText,
+                        {
+                            index
+                            for index, option in enumerate(optionsText)
+                            if is_placeholder_option(option)
+                        },
+                    )
+                    if option_index < 0:
+                        raise
+                    if confidence < MIN_OPTION_CONFIDENCE:
                         # TODO: Use AI to answer the question need to be implemented logic to extract the options for the question
                         print_lg(
-                            f'Failed to find an option with text "{answer}" for question labelled "{label_org}", answering randomly!'
+                            f'Failed to find an option with text "{answer}" for question labelled "{label_org}", answering closest option "{optionsText[option_index]}" (confidence {confidence})!'
                         )
-                        select.select_by_index(randint(1, len(select.options) - 1))
-                        answer = select.first_selected_option.text
                         randomly_answered_questions.add(
                             (f"{label_org} [ {options} ]", "select")
                         )
+                    select.select_by_index(option_index)
+                    answer = optionsText[option_index]
             questions_list.add(
                 (f"{label_org} [ {options} ]", answer, "select", prev_answer)
             )
@@ -1302,16 +1560,16 @@ def answer_questions(
             label = label_org.lower()
 
             label_org += " [ "
-            options = radio.find_elements(By.TAG_NAME, "input")
+            options = read_radio_options(radio)
             options_labels = []
+            options_texts = []
 
             for option in options:
-                id = option.get_attribute("id")
-                option_label = try_xp(radio, f'.//label[@for="{id}"]', False)
+                options_texts.append(option["label"] or "Unknown")
                 options_labels.append(
-                    f'"{option_label.text if option_label else "Unknown"}"<{option.get_attribute("value")}>'
+                    f'"{options_texts[-1]}"<{option["value"]}>'
                 )  # Saving option as "label <value>"
-                if option.is_selected():
+                if option["checked"]:
                     prev_answer = options_labels[-1]
                 label_org += f" {options_labels[-1]},"
 
@@ -1324,32 +1582,31 @@ def answer_questions(
                     answer = disability_status
                 else:
                     answer = answer_common_questions(label, answer)
-                foundOption = try_xp(
-                    radio, f".//label[normalize-space()='{answer}']", False
+                foundOption = next(
+                    (
+                        option["key"]
+                        for option in options
+                        if " ".join(option["label"].split()) == answer
+                    ),
+                    None,
                 )
-                if foundOption:
-                    actions.move_to_element(foundOption).click().perform()
+                if foundOption is not None:
+                    click_radio_option(radio, foundOption)
                 else:
                     possible_answer_phrases = (
                         ["Decline", "not wish", "don't wish", "Prefer not", "not want"]
                         if answer == "Decline"
                         else [answer]
                     )
-                    ele = options[0]
-                    answer = options_labels[0]
-                    for phrase in possible_answer_phrases:
-                        for i, option_label in enumerate(options_labels):
-                            if phrase in option_label:
-                                foundOption = options[i]
-                                ele = foundOption
-                                answer = (
-                                    f"Decline ({option_label})"
-                                    if len(possible_answer_phrases) > 1
-                                    else option_label
-                                )
-                                break
-                        if foundOption:
-                            break
+                    option_index, confidence = best_option_match(
+                        possible_answer_phrases, options_texts
+                    )
+                    ele = options[option_index]["key"]
+                    answer = options_labels[option_index]
+                    if confidence >= MIN_OPTION_CONFIDENCE:
+                        foundOption = ele
+                        if len(possible_answer_phrases) > 1:
+                            answer = f"Decline ({answer})"
                     # if answer == 'Decline':
                     #     answer = options_labels[0]
                     #     for phrase in ["Prefer not", "not want", "not wish"]:
@@ -1358,8 +1615,8 @@ def answer_questions(
                     #             answer = f'Decline ({phrase})'
                     #             ele = foundOption
                     #             break
-                    actions.move_to_element(ele).click().perform()
-                    if not foundOption:
+                    click_radio_option(radio, ele)
+                    if foundOption is None:
                         randomly_answered_questions.add((f"{label_org} ]", "radio"))
             else:
                 answer = prev_answer
@@ -1381,84 +1638,10 @@ def answer_questions(
 
             prev_answer = text.get_attribute("value")
             if not prev_answer or overwrite_previous_answers:
-                if "experience" in label or "years" in label:
-                    answer = years_of_experience
-                elif "phone" in label or "mobile" in label:
-                    answer = phone_number
-                elif "street" in label:
-                    answer = street
-                elif "city" in label or "location" in label or "address" in label:
-                    answer = current_city if current_city else work_location
-                    do_actions = True
-                elif "signature" in label:
-                    answer = full_name  # 'signature' in label or 'legal name' in label or 'your name' in label or 'full name' in label: answer = full_name     # What if question is 'name of the city or university you attend, name of referral etc?'
-                elif "name" in label:
-                    if "full" in label:
-                        answer = full_name
-                    elif "first" in label and "last" not in label:
-                        answer = first_name
-                    elif "middle" in label and "last" not in label:
-                        answer = middle_name
-                    elif "last" in label and "first" not in label:
-                        answer = last_name
-                    elif "employer" in label:
-                        answer = recent_employer
-                    else:
-                        answer = full_name
-                elif "notice" in label:
-                    if "month" in label:
-                        answer = notice_period_months
-                    elif "week" in label:
-                        answer = notice_period_weeks
-                    else:
-                        answer = notice_period
-                elif (
-                    "salary" in label
-                    or "compensation" in label
-                    or "ctc" in label
-                    or "pay" in label
-                ):
-                    if "current" in label or "present" in label:
-                        if "month" in label:
-                            answer = current_ctc_monthly
-                        elif "lakh" in label:
-                            answer = current_ctc_lakhs
-                        else:
-                            answer = current_ctc
-                    else:
-                        if "month" in label:
-                            answer = desired_salary_monthly
-                        elif "lakh" in label:
-                            answer = desired_salary_lakhs
-                        else:
-                            answer = desired_salary
-                elif "linkedin" in label:
-                    answer = linkedIn
-                elif (
-                    "website" in label
-                    or "blog" in label
-                    or "portfolio" in label
-                    or "link" in label
-                ):
-                    answer = website
-                elif "scale of 1-10" in label:
-                    answer = confidence_level
-                elif "headline" in label:
-                    answer = linkedin_headline
-                elif (
-                    ("hear" in label or "come across" in label)
-                    and "this" in label
-                    and ("job" in label or "position" in label)
-                ):
-                    answer = "https://github.com/GodsScion/Auto_job_applier_linkedIn"
-                elif "state" in label or "province" in label:
-                    answer = state
-                elif "zip" in label or "postal" in label or "code" in label:
-                    answer = zipcode
-                elif "country" in label:
-                    answer = country
-                else:
-                    answer = answer_common_questions(label, answer)
+                rule = match_question_rule(text_question_rules, label)
+                if rule:
+                    answer = resolve_rule_answer(rule, work_location=work_location)
+                    do_actions = rule.get("do_actions", False)
                 ##> ------ Yang Li : MARKYangL - Feature ------
                 if answer == "":
                     if use_AI and aiClient:
@@ -1701,10 +1884,11 @@ def external_apply(
         return True, application_link, tabs_count
 
 
-def follow_company(modal: WebDriver = driver) -> None:
+def follow_company(modal: WebDriver | None = None) -> None:
     """
     Function to follow or un-follow easy applied companies based om `follow_companies`
     """
+    modal = modal or driver
     try:
         follow_checkbox_input = try_xp(
             modal, ".//input[@id='follow-company-checkbox' and @type='checkbox']", False
@@ -1772,15 +1956,10 @@ def failed_job(
 
 def screenshot(driver: WebDriver, job_id: str, failedAt: str) -> str:
     """
-    Function to to take screenshot for debugging
+    Function to to take screenshot for debugging (see `modules/debug_capture.py`)
     - Returns screenshot name as String
     """
-    screenshot_name = "{} - {} - {}.png".format(job_id, failedAt, str(datetime.now()))
-    path = logs_folder_path + "/screenshots/" + screenshot_name.replace(":", ".")
-    # special_chars = {'*', '"', '\\', '<', '>', ':', '|', '?'}
-    # for char in special_chars:  path = path.replace(char, '-')
-    driver.save_screenshot(path.replace("//", "/"))
-    return screenshot_name
+    return take_screenshot(driver, job_id, failedAt)
 
 
 # >
@@ -1865,6 +2044,18 @@ def submitted_jobs(
         )
 
 
+# Function to publish the counters and what the bot is doing to the dashboard
+def publish_progress(phase: str | None = None, **fields) -> None:
+    publish_status(
+        phase,
+        easy_applied_count=easy_applied_count,
+        external_jobs_count=external_jobs_count,
+        failed_count=failed_count,
+        skip_count=skip_count,
+        **fields,
+    )
+
+
 # Function to discard the job application
 def discard_job() -> None:
     actions.send_keys(Keys.ESCAPE).perform()
@@ -1885,12 +2076,73 @@ def apply_to_jobs(search_terms: list[str]) -> None:
         tabs_count, \
         pause_before_submit, \
         pause_at_failed_question, \
-        useNewResume
+        useNewResume, \
+        resume_checkpoint, \
+        pending_search_terms
     current_city = current_city.strip()
-
-    if randomize_search_order:
+    use_company_word_lists(about_company_good_words, about_company_bad_words)
+    use_seen_job_settings()
+
+    start_term_index, start_page, processed_job_ids = 0, 1, []
+    if resume_checkpoint:
+        # Same term order as the interrupted run, so term_index points to the same term
+        search_terms = resume_checkpoint["search_terms"]
+        start_term_index = resume_checkpoint["term_index"]
+        start_page = resume_checkpoint["page"]
+        processed_job_ids = resume_checkpoint["processed_job_ids"]
+        rejected_jobs.update(processed_job_ids)
+        print_lg(
+            f'Resuming from search term {start_term_index + 1} of {len(search_terms)}, page {start_page}, after Job ID: {resume_checkpoint.get("last_job_id")}'
+        )
+        resume_checkpoint = None
+    elif randomize_search_order:
         shuffle(search_terms)
 
+    def save_progress(term_index: int, page: int | None, job_id: str | None = None) -> None:
+        if job_id and job_id != "Unknown" and job_id not in processed_job_ids:
+            processed_job_ids.append(job_id)
+        save_checkpoint(
+            search_terms,
+            term_index,
+            page or 1,
+            job_id,
+            processed_job_ids,
+            {
+                "easy_applied_count": easy_applied_count,
+                "external_jobs_count": external_jobs_count,
+                "failed_count": failed_count,
+                "skip_count": skip_count,
+            },
+        )
+
+    # Job being worked on, its outcome is told by which counter went up while on it
+    current_job = {"id": None}
+
+    def start_job(job_id: str, search_term: str) -> None:
+        current_job.update(
+            id=job_id,
+            search_term=search_term,
+            started_at=time.perf_counter(),
+            counters=(easy_applied_count, external_jobs_count, failed_count, skip_count),
+        )
+
+    def finish_job() -> None:
+        if current_job["id"] is None:
+            return
+        counters = (easy_applied_count, external_jobs_count, failed_count, skip_count)
+        outcome = "skipped"
+        for name, before, after in zip(("applied", "external", "failed", "skipped"), current_job["counters"], counters):
+            if after > before:
+                outcome = name
+                break
+        record_job_outcome(
+            current_job["id"],
+            current_job["search_term"],
+            outcome,
+            round(time.perf_counter() - current_job["started_at"], 2),
+        )
+        current_job["id"] = None
+
     def build_search_url(search_term: str) -> str:
         params: dict[str, str] = {"keywords": search_term}
         if search_location.strip():
@@ -1958,8 +2210,37 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                 return True
         return False
 
-    for searchTerm in search_terms:
+    for term_index, searchTerm in enumerate(search_terms):
+        if term_index < start_term_index:
+            continue
+        apply_config_changes()
+        if pending_search_terms is not None:
+            # Replacing the rest of the list in place, the loop continues with the new terms not searched yet
+            searched_terms = search_terms[:term_index]
+            remaining_terms = [term for term in pending_search_terms if term not in searched_terms]
+            if randomize_search_order:
+                shuffle(remaining_terms)
+            search_terms[term_index:] = remaining_terms
+            pending_search_terms = None
+            print_lg(f"Search terms changed, remaining search terms: {remaining_terms}")
+            if not remaining_terms:
+                break
+            searchTerm = search_terms[term_index]
         search_url = build_search_url(searchTerm)
+        if term_index == start_term_index and start_page > 1:
+            # LinkedIn shows 25 jobs per page
+            search_url += f"&start={25 * (start_page - 1)}"
+        save_progress(term_index, start_page if term_index == start_term_index else 1)
+        publish_progress(
+            "searching",
+            current_search_term=searchTerm,
+            current_term_index=term_index + 1,
+            search_terms_count=len(search_terms),
+            current_page=start_page if term_index == start_term_index else 1,
+            current_job_id=None,
+            current_job_title=None,
+            current_company=None,
+        )
         driver.get(search_url)
         if easy_apply_only and "f_AL=true" not in driver.current_url:
             ensure_easy_apply_url_filter()
@@ -1972,6 +2253,13 @@ def apply_to_jobs(search_terms: list[str]) -> None:
         print_lg(f'\n>>>> Now searching for "{searchTerm}" <<<<\n\n')
 
         apply_filters()
+        resume_page = start_page if term_index == start_term_index and start_page > 1 else None
+        if resume_page:
+            # Applying filters starts a new search on page 1, go back to the saved page
+            try:
+                ensure_search_url_param("start", str(25 * (resume_page - 1)))
+            except Exception as e:
+                print_lg(f"Failed to reopen page {resume_page} of the search results.", e)
 
         current_count = 0
         try:
@@ -1984,12 +2272,26 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                 wait.until(lambda d: len(get_job_listings()) > 0)
 
                 pagination_element, current_page = get_page_info()
+                if resume_page:
+                    if current_page != resume_page:
+                        print_lg(
+                            f"Expected to resume on page {resume_page} but LinkedIn shows page {current_page}. Already processed jobs will be skipped."
+                        )
+                    resume_page = None
+                publish_progress("reading jobs", current_page=current_page)
 
                 # Find all job listings in current page
                 buffer(3)
                 job_listings = get_job_listings()
+                last_job_id = None
 
                 for index in range(len(job_listings)):
+                    # Previous job is done (applied, skipped or failed), remember it in case the bot is interrupted
+                    finish_job()
+                    if last_job_id:
+                        save_progress(term_index, current_page, last_job_id)
+                        last_job_id = None
+                    apply_config_changes()
                     refreshed_listings = get_job_listings()
                     if index >= len(refreshed_listings):
                         break
@@ -2009,9 +2311,12 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         skip,
                         job_link,
                     ) = get_job_main_details(job, blacklisted_companies, rejected_jobs)
+                    last_job_id = job_id
+                    publish_progress("checking job", current_job_id=job_id, current_job_title=title, current_company=company)
 
                     if skip:
                         continue
+                    start_job(job_id, searchTerm)
 
                     # Check if job location is in exclude list (e.g., UK)
                     if exclude_locations:
@@ -2084,6 +2389,9 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                             "Skipped",
                             screenshot_name,
                         )
+                        record_seen_job(
+                            job_id, "rejected", "Found Blacklisted words in About Company"
+                        )
                         skip_count += 1
                         continue
                     except Exception as e:
@@ -2154,6 +2462,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                             screenshot_name,
                         )
                         rejected_jobs.add(job_id)
+                        record_seen_job(job_id, "rejected", reason)
                         skip_count += 1
                         continue
                     if english_only_jobs:
@@ -2175,6 +2484,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                 screenshot_name,
                             )
                             rejected_jobs.add(job_id)
+                            record_seen_job(job_id, "rejected", reason)
                             skip_count += 1
                             continue
 
@@ -2196,6 +2506,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         ##<
 
                     uploaded = False
+                    publish_progress("applying")
                     # Case 1: Easy Apply Button
                     if try_xp(
                         driver,
@@ -2389,6 +2700,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                             print_lg(
                                 "\n###############  Daily application limit for Easy Apply is reached!  ###############\n"
                             )
+                            clear_checkpoint()
                             return
                         if skip:
                             continue
@@ -2425,11 +2737,18 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     else:
                         external_jobs_count += 1
                     applied_jobs.add(job_id)
+                    finish_job()
+                    publish_progress("waiting")
                     print_lg(
                         "Waiting 30 seconds before the next application to reduce LinkedIn automation risk..."
                     )
                     time.sleep(30)
 
+                finish_job()
+                if last_job_id:
+                    save_progress(term_index, current_page, last_job_id)
+                publish_progress()
+
                 # Switching to next page
                 if pagination_element == None:
                     print_lg(
@@ -2448,6 +2767,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     if under_10_applicants:
                         ensure_under_10_applicants_url_filter()
                     print_lg(f"\n>-> Now on Page {current_page + 1} \n")
+                    save_progress(term_index, current_page + 1)
                 except NoSuchElementException:
                     print_lg(
                         f"\n>-> Didn't find Page {current_page + 1}. Probably at the end page of results!\n"
@@ -2472,6 +2792,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         if under_10_applicants:
                             ensure_under_10_applicants_url_filter()
                         print_lg(f"\n>-> Now on Page {current_page + 1} \n")
+                        save_progress(term_index, current_page + 1)
                     except Exception:
                         print_lg(
                             f"\n>-> Retry failed for Page {current_page + 1}. Ending this result set.\n"
@@ -2494,13 +2815,18 @@ def apply_to_jobs(search_terms: list[str]) -> None:
             print_lg("Failed to find Job listings!")
             critical_error_log("In Applier", e)
             try:
-                print_lg(driver.page_source, pretty=True)
+                snapshot_id = save_page_snapshot(driver, "Failed to find Job listings")
+                if snapshot_id:
+                    print_lg(f'Saved page snapshot "{snapshot_id}" in "{logs_folder_path}snapshots/"')
             except Exception as page_source_error:
                 print_lg(
                     f"Failed to get page source, browser might have crashed. {page_source_error}"
                 )
             # print_lg(e)
 
+    # Finished all search terms, nothing to resume
+    clear_checkpoint()
+
 
 def run(total_runs: int) -> int:
     if dailyEasyApplyLimitReached:
@@ -2510,6 +2836,7 @@ def run(total_runs: int) -> int:
     )
     print_lg(f"Date and Time: {datetime.now()}")
     print_lg(f"Cycle number: {total_runs}")
+    publish_progress("running", total_runs=total_runs, date_posted=date_posted, sort_by=sort_by)
     print_lg(
         f"Currently looking for jobs posted within '{date_posted}' and sorting them by '{sort_by}'"
     )
@@ -2518,6 +2845,7 @@ def run(total_runs: int) -> int:
         "########################################################################################################################\n"
     )
     if run_non_stop and not dailyEasyApplyLimitReached:
+        publish_progress("sleeping")
         print_lg("Sleeping for 10 min...")
         sleep(300)
         print_lg("Few more min... Gonna start with in next 5 min...")
@@ -2531,11 +2859,38 @@ linkedIn_tab = False
 
 
 def main() -> None:
+    global driver, actions, wait
     total_runs = 1
+    start_status()
+    print_lg(
+        f"Loaded modules in {import_time:.2f} secs. (Run `python -X importtime runAiBot.py` to see what's slow)"
+    )
+    browser_started_at = time.perf_counter()
+    _, driver, actions, wait = open_browser()
+    if driver is None:
+        publish_status("finished", error="Failed to open the browser")
+        return
+    print_lg(f"Browser ready in {time.perf_counter() - browser_started_at:.2f} secs.")
     try:
-        global linkedIn_tab, tabs_count, useNewResume, aiClient
+        global linkedIn_tab, tabs_count, useNewResume, aiClient, resume_checkpoint, \
+            easy_applied_count, external_jobs_count, failed_count, skip_count
         alert_title = "Error Occurred. Closing Browser!"
         validate_config()
+        watch_configs()
+
+        if resume_from_checkpoint:
+            resume_checkpoint = load_checkpoint(search_terms)
+            if resume_checkpoint:
+                counters = resume_checkpoint["counters"]
+                easy_applied_count = counters.get("easy_applied_count", 0)
+                external_jobs_count = counters.get("external_jobs_count", 0)
+                failed_count = counters.get("failed_count", 0)
+                skip_count = counters.get("skip_count", 0)
+                print_lg(
+                    f"Found a checkpoint of an interrupted run saved at {datetime.fromtimestamp(resume_checkpoint.get('saved_at', 0))}, resuming it."
+                )
+        else:
+            clear_checkpoint()
 
         if not os.path.exists(default_resume_path):
             pyautogui.alert(
@@ -2547,11 +2902,17 @@ def main() -> None:
             )
             useNewResume = False
 
-        # Login to LinkedIn
+        # Login to LinkedIn, a kept open browser or saved cookies from the last run skip the login page
+        publish_progress("logging in")
         tabs_count = len(driver.window_handles)
-        driver.get("https://www.linkedin.com/login")
+        restored_login = not has_session_cookie(driver) and restore_session_cookies(driver)
+        driver.get("https://www.linkedin.com/feed/")
         if not is_logged_in_LN():
+            if restored_login:
+                print_lg("Saved LinkedIn login has expired, logging in again.")
+                forget_session_cookies()
             login_LN()
+        save_session_cookies(driver)
 
         linkedIn_tab = driver.current_window_handle
 
@@ -2638,6 +2999,7 @@ def main() -> None:
             failed_count,
             skip_count,
         )
+        publish_progress("finished", total_runs=total_runs)
         print_lg(summary)
         print_lg("\n\nTotal runs:                     {}".format(total_runs))
         print_lg("Jobs Easy Applied:              {}".format(easy_applied_count))
@@ -2703,7 +3065,11 @@ def main() -> None:
                 print_lg("Failed to close AI client:", e)
         ##<
         try:
-            if driver:
+            if driver and reuse_browser_session:
+                print_lg(
+                    f"Leaving the browser open to reuse it in the next run (reuse_browser_session = True, port {remote_debugging_port})."
+                )
+            elif driver:
                 driver.quit()
         except WebDriverException as e:
             print_lg("Browser already closed.", e)